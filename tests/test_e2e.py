@@ -82,6 +82,7 @@ def write_config(tmp_path, data_dir):
             'groceries': ['grocery'],
         },
         'output_dir': str(data_dir),
+        'emit_pivot': True,
         'google': {
             'service_account_file': 'creds.json',
             'sheet_folder_id': 'folder',
@@ -247,10 +248,15 @@ def test_cli_excel_output(tmp_path):
     assert rows[-1][0] == 'Grand Total'
     assert rows[-1][2] == pytest.approx(79.12)
 
+    charts_ws = wb['Charts']
+    assert charts_ws['A2'].value == 'May 2025'
+    assert charts_ws['B2'].value == pytest.approx(79.12)
+
 
 class FakeWorksheet:
-    def __init__(self, title):
+    def __init__(self, title, sheet_id=0):
         self.title = title
+        self.id = sheet_id
         self.rows = []
         self.spreadsheet = types.SimpleNamespace(id='123')
 
@@ -284,6 +290,8 @@ class FakeSpreadsheet:
         self.id = '123'
         self.sheet1 = FakeWorksheet('Sheet1')
         self._worksheets = [self.sheet1]
+        self.developer_metadata = {}
+        self.batch_updates = []
 
     def worksheet(self, title):
         for ws in self._worksheets:
@@ -292,10 +300,85 @@ class FakeSpreadsheet:
         raise sheets_output.gspread.exceptions.WorksheetNotFound
 
     def add_worksheet(self, title, rows='100', cols='10'):
-        ws = FakeWorksheet(title)
+        ws = FakeWorksheet(title, sheet_id=max(ws.id for ws in self._worksheets) + 1)
         self._worksheets.append(ws)
         return ws
 
+    def sheet_properties(self):
+        return [
+            {
+                'properties': {'title': ws.title, 'sheetId': ws.id, 'index': idx},
+                'tables': [],
+                'developerMetadata': list(self.developer_metadata.get(ws.id, {}).values()),
+            }
+            for idx, ws in enumerate(self._worksheets)
+        ]
+
+    def apply_requests(self, requests):
+        if not requests:
+            raise ValueError('Must specify at least one request.')
+        self.batch_updates.append(requests)
+        replies = []
+        for req in requests:
+            if 'addSheet' in req:
+                ws = self.add_worksheet(req['addSheet']['properties']['title'])
+                replies.append({'addSheet': {'properties': {
+                    'title': ws.title, 'sheetId': ws.id, 'index': self._worksheets.index(ws)
+                }}})
+                continue
+            if 'createDeveloperMetadata' in req:
+                md = dict(req['createDeveloperMetadata']['developerMetadata'])
+                md['metadataId'] = max(
+                    (mid for entries in self.developer_metadata.values() for mid in entries), default=0
+                ) + 1
+                self.developer_metadata.setdefault(md['location']['sheetId'], {})[md['metadataId']] = md
+                replies.append({})
+                continue
+            if 'deleteDeveloperMetadata' in req:
+                lookup = req['deleteDeveloperMetadata']['dataFilter']['developerMetadataLookup']
+                entries = self.developer_metadata.get(lookup['metadataLocation']['sheetId'], {})
+                for mid in [m for m, md in entries.items() if md['metadataKey'] == lookup['metadataKey']]:
+                    del entries[mid]
+                replies.append({})
+                continue
+            if 'updateDeveloperMetadata' in req:
+                body = req['updateDeveloperMetadata']
+                metadata_id = body['dataFilters'][0]['developerMetadataLookup']['metadataId']
+                for entries in self.developer_metadata.values():
+                    if metadata_id in entries:
+                        entries[metadata_id]['metadataValue'] = body['developerMetadata']['metadataValue']
+                replies.append({})
+                continue
+            if 'updateCells' in req:
+                self.update_cells(req['updateCells'])
+                replies.append({})
+                continue
+            props = req.get('updateSheetProperties', {}).get('properties', {})
+            if 'index' in props:
+                ws = next(ws for ws in self._worksheets if ws.id == props['sheetId'])
+                self._worksheets.remove(ws)
+                self._worksheets.insert(props['index'], ws)
+            if 'title' in props:
+                for ws in self._worksheets:
+                    if ws.id == props['sheetId']:
+                        ws.update_title(props['title'])
+            replies.append({})
+        return {'replies': replies}
+
+    def update_cells(self, body):
+        target = body.get('start') or body['range']
+        ws = next(ws for ws in self._worksheets if ws.id == target['sheetId'])
+        if 'rows' not in body:
+            ws.rows = []
+            return
+        start = target.get('rowIndex', 0)
+        values = [
+            [next(iter(cell.get('userEnteredValue', {}).values()), '') for cell in row['values']]
+            for row in body['rows']
+        ]
+        ws.rows = ws.rows + [[] for _ in range(start + len(values) - len(ws.rows))]
+        ws.rows[start:start + len(values)] = values
+
     def worksheets(self):
         return self._worksheets
 
@@ -330,6 +413,10 @@ def setup_sheet_mocks(monkeypatch):
             pass
 
     monkeypatch.setattr(sheets_output, 'Credentials', FakeCreds)
+    # The Drive caches live on the class; give each test its own so parents
+    # and permissions from an earlier test's spreadsheet '123' don't leak in
+    monkeypatch.setattr(sheets_output.SheetsOutput, '_drive_parents_cache', {})
+    monkeypatch.setattr(sheets_output.SheetsOutput, '_permissions_cache', {})
     client = FakeClient()
     monkeypatch.setattr(
         sheets_output,
@@ -347,47 +434,26 @@ def setup_sheet_mocks(monkeypatch):
                 if 'parents' in fields:
                     data = {'parents': []}
                 elif 'sheets.properties' in fields or 'sheets(properties' in fields:
-                    data = {
-                        'sheets': [
-                            {'properties': {'title': 'Sheet1', 'sheetId': 1}, 'tables': []},
-                            {'properties': {'title': 'May 2025', 'sheetId': 2}, 'tables': []},
-                            {'properties': {'title': 'AllData', 'sheetId': 3}, 'tables': []},
-                            {'properties': {'title': 'Summary', 'sheetId': 4}, 'tables': []},
-                            {'properties': {'title': 'Charts', 'sheetId': 5}, 'tables': []},
-                        ]
-                    }
+                    data = {'sheets': sheet.sheet_properties()}
                 else:
                     data = {}
-                return types.SimpleNamespace(execute=lambda: data)
+                return types.SimpleNamespace(execute=lambda **_k: data)
             def update(self, *a, **k):
-                return types.SimpleNamespace(execute=lambda: {})
+                return types.SimpleNamespace(execute=lambda **_k: {})
             def spreadsheets(self):
                 return self
             def batchUpdate(self, *a, **k):
-                return types.SimpleNamespace(execute=lambda: {})
+                requests = k.get('body', {}).get('requests', [])
+                return types.SimpleNamespace(execute=lambda **_k: sheet.apply_requests(requests))
             def values(self):
                 class ValuesDummy:
-                    def batchClear(self_inner, *a, **k):
-                        ranges = k.get('body', {}).get('ranges', [])
-                        for rng in ranges:
+                    def batchGet(self_inner, *a, **k):
+                        value_ranges = []
+                        for rng in k.get('ranges', []):
                             title = rng.split('!')[0].strip("'")
-                            try:
-                                ws = sheet.worksheet(title)
-                            except sheets_output.gspread.exceptions.WorksheetNotFound:
-                                continue
-                            ws.rows = []
-                        return types.SimpleNamespace(execute=lambda: {})
-                    def batchUpdate(self_inner, *a, **k):
-                        data = k.get('body', {}).get('data', [])
-                        for item in data:
-                            rng = item.get('range', '')
-                            title = rng.split('!')[0].strip("'")
-                            try:
-                                ws = sheet.worksheet(title)
-                            except sheets_output.gspread.exceptions.WorksheetNotFound:
-                                continue
-                            ws.rows = item.get('values', [])
-                        return types.SimpleNamespace(execute=lambda: {})
+                            rows = sheet.worksheet(title).get_all_values()[1:]
+                            value_ranges.append({'range': rng, 'values': [r[:5] for r in rows]})
+                        return types.SimpleNamespace(execute=lambda **_k: {'valueRanges': value_ranges})
                 return ValuesDummy()
         return Dummy()
 
@@ -435,6 +501,113 @@ def test_all_data_preserves_amounts(tmp_path, monkeypatch):
     assert amounts == sorted([56.78, 12.34, 10.0])
 
 
+def test_all_data_merges_existing_month_tabs(tmp_path, monkeypatch):
+    client = setup_sheet_mocks(monkeypatch)
+    april = client.sheet.add_worksheet('April 2025')
+    april.rows = [
+        ['date', 'description', 'merchant', 'category', 'amount'],
+        ['2025-04-10', 'Old Grocery', 'Grocer', 'groceries', '$1,234.50'],
+    ]
+    charts = client.sheet.add_worksheet('Charts')
+    charts.rows = [['Month', 'Total'], ['April 2025', '1234.5']]
+    stmts = tmp_path / 'stmts'
+    stmts.mkdir()
+    write_tdvisa_sample(stmts / 'tdvisa.csv')
+    cfg_path = write_config(tmp_path, tmp_path / 'data')
+
+    res = CliRunner().invoke(
+        cli,
+        ['--dir', str(stmts), '--output', 'sheets', '--config', str(cfg_path)]
+    )
+    assert res.exit_code == 0, res.output
+    all_rows = client.sheet.worksheet('AllData').rows
+    assert {r[0] for r in all_rows[1:]} == {'April 2025', 'May 2025'}
+    april_rows = [r for r in all_rows[1:] if r[0] == 'April 2025']
+    # Dates are written as Sheets serial numbers (days since 1899-12-30)
+    assert april_rows == [['April 2025', 45757, 'Old Grocery', 'Grocer', 'groceries', 1234.5]]
+    assert [ws.title for ws in client.sheet.worksheets()] == [
+        'Summary', 'Charts', 'AllData', 'April 2025', 'May 2025'
+    ]
+
+
+def test_sheets_append_drops_duplicate_transactions(tmp_path, monkeypatch):
+    from datetime import date
+    from transaction_tracker.core.models import Transaction
+
+    client = setup_sheet_mocks(monkeypatch)
+    cfg = yaml.safe_load(write_config(tmp_path, tmp_path / 'data').read_text())
+    tx = Transaction(date(2025, 5, 3), 'Coffee', 'Cafe', 4.5)
+    other = Transaction(date(2025, 5, 4), 'Coffee', 'Cafe', 4.5)
+
+    sheets_output.SheetsOutput(cfg).append([tx, other, tx])
+    may_rows = client.sheet.worksheet('May 2025').rows
+    assert [r[0] for r in may_rows[1:]] == [45780, 45781]
+
+
+def test_sheets_append_skips_unchanged_tabs(tmp_path, monkeypatch):
+    from datetime import date
+    from transaction_tracker.core.models import Transaction
+
+    client = setup_sheet_mocks(monkeypatch)
+    cfg = yaml.safe_load(write_config(tmp_path, tmp_path / 'data').read_text())
+    txs = [Transaction(date(2025, 5, 3), 'Coffee', 'Cafe', 4.5)]
+
+    sheets_output.SheetsOutput(cfg).append(txs)
+    for title in ('May 2025', 'AllData'):
+        client.sheet.worksheet(title).rows = [['untouched']]
+
+    client.sheet.batch_updates.clear()
+    sheets_output.SheetsOutput(cfg).append(txs)
+    assert client.sheet.batch_updates == []
+    assert client.sheet.worksheet('May 2025').rows == [['untouched']]
+    assert client.sheet.worksheet('AllData').rows == [['untouched']]
+
+    txs.append(Transaction(date(2025, 5, 4), 'Tea', 'Cafe', 3.0))
+    sheets_output.SheetsOutput(cfg).append(txs)
+    assert len(client.sheet.worksheet('May 2025').rows) == 3
+    assert len(client.sheet.worksheet('AllData').rows) == 3
+
+
+@pytest.mark.parametrize('deleted', ['Summary', 'Charts'])
+def test_sheets_append_rebuilds_deleted_aggregate_tabs(tmp_path, monkeypatch, deleted):
+    from datetime import date
+    from transaction_tracker.core.models import Transaction
+
+    client = setup_sheet_mocks(monkeypatch)
+    cfg = yaml.safe_load(write_config(tmp_path, tmp_path / 'data').read_text())
+    txs = [Transaction(date(2025, 5, 3), 'Coffee', 'Cafe', 4.5)]
+
+    sheets_output.SheetsOutput(cfg).append(txs)
+    expected = client.sheet.worksheet(deleted).rows
+    assert expected
+    client.sheet._worksheets.remove(client.sheet.worksheet(deleted))
+
+    sheets_output.SheetsOutput(cfg).append(txs)
+    assert client.sheet.worksheet(deleted).rows == expected
+
+
+def test_sheets_append_refreshes_fingerprints_between_calls(tmp_path, monkeypatch):
+    from datetime import date
+    from transaction_tracker.core.models import Transaction
+
+    client = setup_sheet_mocks(monkeypatch)
+    cfg = yaml.safe_load(write_config(tmp_path, tmp_path / 'data').read_text())
+    first = [Transaction(date(2025, 5, 3), 'Coffee', 'Cafe', 4.5)]
+    second = [Transaction(date(2025, 5, 4), 'Tea', 'Cafe', 3.0)]
+
+    out = sheets_output.SheetsOutput(cfg)
+    out.append(first)
+    out.append(second)
+    assert all(
+        len([md for md in entries.values() if md['metadataKey'] == out.FINGERPRINT_KEY]) == 1
+        for entries in client.sheet.developer_metadata.values()
+    )
+
+    sheets_output.SheetsOutput(cfg).append(first)
+    assert [r[1] for r in client.sheet.worksheet('May 2025').rows[1:]] == ['Coffee']
+    assert [r[2] for r in client.sheet.worksheet('AllData').rows[1:]] == ['Coffee']
+
+
 def test_cli_ai_report(tmp_path, monkeypatch):
     stmts = tmp_path / 'stmts'
     stmts.mkdir()
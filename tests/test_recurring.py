@@ -1,5 +1,6 @@
 from datetime import date
 
+import pytest
 import yaml
 from click.testing import CliRunner
 
@@ -85,6 +86,42 @@ def test_expand_recurring_end_date_is_inclusive():
     ]
 
 
+def test_expand_recurring_monthly_clamps_to_month_end():
+    txs = expand_recurring_transactions(
+        [
+            {
+                "description": "Rent",
+                "merchant": "Landlord",
+                "amount": 1000,
+                "cadence": "monthly",
+                "start_date": "2025-01-31",
+                "end_date": "2025-04-29",
+            }
+        ]
+    )
+    assert [tx.date for tx in txs] == [
+        date(2025, 1, 31),
+        date(2025, 2, 28),
+        date(2025, 3, 31),
+    ]
+
+
+def test_expand_recurring_rejects_unsupported_cadence_with_empty_range():
+    with pytest.raises(ValueError, match="Unsupported cadence 'yearly'"):
+        expand_recurring_transactions(
+            [
+                {
+                    "description": "Membership",
+                    "merchant": "Club",
+                    "amount": 50,
+                    "cadence": "yearly",
+                    "start_date": "2025-03-01",
+                    "end_date": "2025-02-01",
+                }
+            ]
+        )
+
+
 def test_expand_recurring_defaults_end_date_to_today(monkeypatch):
     import transaction_tracker.recurring as recurring
 
@@ -1,4 +1,9 @@
-from transaction_tracker.outputs.sheets_output import SheetsOutput
+import types
+from datetime import date
+
+from transaction_tracker.core.categorizer import categorize, compile_categorizer
+from transaction_tracker.core.models import Transaction
+from transaction_tracker.outputs.sheets_output import SheetsOutput, _cell_data, _date_cell_data, _to_float
 
 
 def test_table_and_sort_requests_monthly():
@@ -149,3 +154,228 @@ def test_charts_tab_requests_anchors_pie_within_grid():
     )
     anchor = pie_request['addChart']['chart']['position']['overlayPosition']['anchorCell']
     assert anchor['columnIndex'] == 8
+
+
+def test_compile_categorizer_matches_categorize():
+    categories = {
+        'restaurants': ['Cafe', 'a+b (grill)'],
+        'groceries': ['fresh', 'MARKET'],
+        'car': [],
+        'fun': ['cafe'],
+    }
+    txs = [
+        Transaction(date=date(2024, 1, 1), description='Lunch', merchant='Bean CAFE', amount=5.0),
+        Transaction(date=date(2024, 1, 2), description='A+B (Grill) dinner', merchant='X', amount=5.0),
+        Transaction(date=date(2024, 1, 3), description='Weekly shop', merchant='Farmers Market', amount=5.0),
+        Transaction(date=date(2024, 1, 4), description='Fresh cafe', merchant='Corner', amount=5.0),
+        Transaction(date=date(2024, 1, 5), description='Unknown', merchant='Nowhere', amount=5.0),
+    ]
+    match = compile_categorizer(categories)
+    assert [match(tx) for tx in txs] == [categorize(tx, categories) for tx in txs]
+    assert [match(tx) for tx in txs] == ['restaurants', 'restaurants', 'groceries', 'restaurants', 'misc']
+
+
+class _FakeDriveFiles:
+    def __init__(self, parents):
+        self.parents = parents
+        self.calls = []
+
+    def files(self):
+        return self
+
+    def get(self, **kwargs):
+        self.calls.append('get')
+        return types.SimpleNamespace(execute=lambda **_k: {'parents': list(self.parents)})
+
+    def update(self, **kwargs):
+        self.calls.append('update')
+        return types.SimpleNamespace(execute=lambda **_k: {})
+
+
+def test_move_to_folder_caches_parents():
+    out = object.__new__(SheetsOutput)
+    out.folder_id = 'folder'
+    out.drive_srv = _FakeDriveFiles(['root'])
+    out._drive_parents_cache = {}
+    sh = types.SimpleNamespace(id='sheet-1')
+
+    out._move_to_folder(sh)
+    out._move_to_folder(sh)
+
+    assert out.drive_srv.calls == ['get', 'update']
+    assert out._drive_parents_cache['sheet-1'][1] == {'folder'}
+
+    # Expired entries are refetched
+    out._drive_parents_cache['sheet-1'] = (0, {'folder'})
+    out.drive_srv.parents = ['folder']
+    out._move_to_folder(sh)
+    assert out.drive_srv.calls == ['get', 'update', 'get']
+
+
+class _FakeBatch:
+    def __init__(self, callback):
+        self.callback = callback
+        self.requests = []
+
+    def add(self, request, request_id):
+        if any(rid == request_id for rid, _ in self.requests):
+            raise KeyError(request_id)
+        self.requests.append((request_id, request))
+
+    def execute(self):
+        for request_id, _request in self.requests:
+            self.callback(request_id, {'id': 'perm'}, None)
+
+
+class _FakeDrivePermissions:
+    def __init__(self):
+        self.batches = []
+
+    def new_batch_http_request(self, callback):
+        batch = _FakeBatch(callback)
+        self.batches.append(batch)
+        return batch
+
+    def permissions(self):
+        return self
+
+    def create(self, **kwargs):
+        return kwargs
+
+
+def test_share_with_owners_batches_missing_owners():
+    out = object.__new__(SheetsOutput)
+    out.owners = ['a@example.com', 'b@example.com', 'c@example.com']
+    out.drive_srv = _FakeDrivePermissions()
+    out._permissions_cache = {}
+    sh = types.SimpleNamespace(
+        id='sheet-1',
+        list_permissions=lambda: [{'emailAddress': 'b@example.com'}],
+    )
+
+    out._share_with_owners(sh)
+    out._share_with_owners(sh)
+
+    assert len(out.drive_srv.batches) == 1
+    shared = [rid for rid, _ in out.drive_srv.batches[0].requests]
+    assert shared == ['a@example.com', 'c@example.com']
+    assert out._permissions_cache['sheet-1'][1] == set(out.owners)
+
+
+def test_share_with_owners_collapses_repeated_owners():
+    out = object.__new__(SheetsOutput)
+    out.owners = ['A@example.com', 'a@example.com', 'B@Example.com', 'c@example.com', 'c@example.com']
+    out.drive_srv = _FakeDrivePermissions()
+    out._permissions_cache = {}
+    sh = types.SimpleNamespace(
+        id='sheet-1',
+        list_permissions=lambda: [{'emailAddress': 'b@example.com'}],
+    )
+
+    out._share_with_owners(sh)
+
+    [batch] = out.drive_srv.batches
+    assert [rid for rid, _ in batch.requests] == ['a@example.com', 'c@example.com']
+    assert batch.requests[0][1]['body']['emailAddress'] == 'A@example.com'
+
+
+class _FakeSheetsService:
+    def __init__(self, sheets):
+        self.sheets = sheets
+        self.calls = []
+
+    def spreadsheets(self):
+        return self
+
+    def get(self, **kwargs):
+        self.calls.append('get')
+        return types.SimpleNamespace(execute=lambda **_k: {'sheets': self.sheets})
+
+    def batchUpdate(self, **kwargs):
+        self.calls.append('batchUpdate')
+        replies = []
+        for idx, req in enumerate(kwargs['body']['requests']):
+            if 'addSheet' in req:
+                props = dict(req['addSheet']['properties'], sheetId=100 + idx)
+                replies.append({'addSheet': {'properties': props}})
+            else:
+                replies.append({})
+        return types.SimpleNamespace(execute=lambda **_k: {'replies': replies})
+
+
+def test_ensure_tabs_reuses_metadata_for_new_tabs():
+    out = object.__new__(SheetsOutput)
+    out.sheets_srv = _FakeSheetsService([{'properties': {'title': 'Sheet1', 'sheetId': 0}}])
+    out._sheet_meta_cache = None
+    sh = types.SimpleNamespace(id='sheet-1')
+
+    created = out._ensure_tabs(sh, {'May 2025': (100, 10), 'AllData': (100, 6)}, created_ss=True)
+    meta = out._get_sheet_meta(sh)
+
+    assert created == {'May 2025', 'AllData'}
+    assert out._ensure_tabs(sh, {'May 2025': (100, 10)}, created_ss=False) == set()
+
+    assert out.sheets_srv.calls == ['get', 'batchUpdate']
+    assert {s['properties']['title']: s['properties']['sheetId'] for s in meta} == {
+        'May 2025': 0,
+        'AllData': 101,
+    }
+
+
+def test_fingerprint_requests_keep_a_single_entry():
+    out = object.__new__(SheetsOutput)
+
+    assert out._stored_fingerprints({'properties': {'sheetId': 3}}) == []
+    [create] = out._fingerprint_requests(3, 'abc')
+    md = create['createDeveloperMetadata']['developerMetadata']
+    assert md['metadataKey'] == SheetsOutput.FINGERPRINT_KEY
+    assert md['metadataValue'] == 'abc'
+    assert md['location'] == {'sheetId': 3}
+
+    stored = {'metadataId': 42, 'metadataKey': SheetsOutput.FINGERPRINT_KEY, 'metadataValue': 'abc'}
+    sheet_meta = {'developerMetadata': [{'metadataId': 1, 'metadataKey': 'other'}, stored]}
+    assert out._stored_fingerprints(sheet_meta) == [stored]
+    [update] = out._fingerprint_requests(3, 'def', [stored])
+    assert update['updateDeveloperMetadata']['dataFilters'] == [{'developerMetadataLookup': {'metadataId': 42}}]
+    assert update['updateDeveloperMetadata']['developerMetadata'] == {'metadataValue': 'def'}
+
+    duplicate = dict(stored, metadataId=43)
+    delete, create = out._fingerprint_requests(3, 'def', [stored, duplicate])
+    assert delete['deleteDeveloperMetadata']['dataFilter']['developerMetadataLookup'] == {
+        'metadataKey': SheetsOutput.FINGERPRINT_KEY,
+        'metadataLocation': {'sheetId': 3},
+    }
+    assert create['createDeveloperMetadata']['developerMetadata']['metadataValue'] == 'def'
+
+
+def test_to_float_parses_formatted_amounts():
+    assert _to_float(12) == 12.0
+    assert _to_float('$1,234.50') == 1234.5
+    assert _to_float('-4.25') == -4.25
+    assert _to_float('') == 0.0
+    assert _to_float('n/a') == 0.0
+
+
+def test_cell_data_types_values():
+    assert _cell_data(4.5) == {'userEnteredValue': {'numberValue': 4.5}}
+    assert _cell_data('Cafe') == {'userEnteredValue': {'stringValue': 'Cafe'}}
+    assert _cell_data(True) == {'userEnteredValue': {'boolValue': True}}
+    assert _cell_data('') == {}
+    assert _cell_data(None) == {}
+    assert _date_cell_data('2025-05-03') == {'userEnteredValue': {'numberValue': 45780}}
+    assert _date_cell_data('date') == {'userEnteredValue': {'stringValue': 'date'}}
+
+
+def test_ensure_grid_rows_only_grows_short_grids():
+    out = object.__new__(SheetsOutput)
+    sheet_meta = {'properties': {'sheetId': 7, 'gridProperties': {'rowCount': 100}}}
+    requests = []
+    out._ensure_grid_rows(requests, sheet_meta, 100)
+    assert requests == []
+    out._ensure_grid_rows(requests, sheet_meta, 250)
+    assert requests == [{
+        'updateSheetProperties': {
+            'properties': {'sheetId': 7, 'gridProperties': {'rowCount': 250}},
+            'fields': 'gridProperties.rowCount'
+        }
+    }]
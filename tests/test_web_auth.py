@@ -48,3 +48,66 @@ def test_render_index_html_uses_home_env(monkeypatch):
 
     assert "<title>Budgify | Ali&#x27;s Home</title>" in rendered
     assert "<h1>Ali&#x27;s Home spending, powered by Budgify.</h1>" in rendered
+
+
+def test_dump_json_matches_stdlib(monkeypatch):
+    import json
+
+    payload = {"total": 12.5, "rows": [{"merchant": "Café", "count": 2}], 3: None}
+    expected = json.loads(json.dumps(payload))
+    assert json.loads(web._dump_json(payload)) == expected
+    monkeypatch.setattr(web, "orjson", None)
+    assert json.loads(web._dump_json(payload)) == expected
+
+
+def test_extract_params_parses_and_applies_defaults():
+    from datetime import date
+
+    query = {
+        "start_date": ["2025-01-01"],
+        "min_amount": ["12.5"],
+        "sort_by": [""],
+        "limit": ["0"],
+        "offset": ["40"],
+    }
+    params = web._extract_params(query, web._TRANSACTION_PARAMS)
+    assert params["start_date"] == date(2025, 1, 1)
+    assert params["end_date"] is None
+    assert params["min_amount"] == 12.5
+    assert params["sort_by"] == "date"
+    assert params["sort_dir"] == "asc"
+    assert params["limit"] == 200
+    assert params["offset"] == 40
+    assert params["merchant"] is None
+
+
+def test_load_password_entry_reuses_decoded_password(tmp_path, monkeypatch):
+    import os
+
+    key = "Altaf Hussain"
+    path = tmp_path / "password.txt"
+    path.write_text(web._encode_password("first", key), encoding="utf-8")
+    assert web._load_password_entry(str(path), key) == ("first", web._password_digest("first"))
+
+    calls = []
+    original = web._decode_password
+    monkeypatch.setattr(web, "_decode_password", lambda *a: calls.append(a) or original(*a))
+    assert web._load_password_entry(str(path), key) == ("first", web._password_digest("first"))
+    assert calls == []
+
+    path.write_text(web._encode_password("second-pass", key), encoding="utf-8")
+    os.utime(path, ns=(0, 10**9))
+    assert web._load_password_entry(str(path), key) == ("second-pass", web._password_digest("second-pass"))
+    assert len(calls) == 1
+    assert web._load_password_entry(str(tmp_path / "missing"), key) is None
+
+
+def test_accepts_gzip_honours_quality_values():
+    assert web._accepts_gzip("gzip, deflate, br")
+    assert web._accepts_gzip("deflate, GZIP;q=0.5")
+    assert web._accepts_gzip("*")
+    assert not web._accepts_gzip(None)
+    assert not web._accepts_gzip("gzip;q=0")
+    assert not web._accepts_gzip("gzip; q=0.0, *")
+    assert not web._accepts_gzip("x-gzip")
+    assert not web._accepts_gzip("br, *;q=0")
@@ -0,0 +1,279 @@
+import gzip
+import http.client
+import json
+import threading
+import time
+from datetime import date
+
+import pytest
+
+from transaction_tracker import web
+from transaction_tracker.core.models import Transaction
+from transaction_tracker.database import append_transactions
+
+
+@pytest.fixture
+def server(tmp_path):
+    db_path = tmp_path / "budgify.db"
+    append_transactions(
+        [Transaction(date=date(2025, 1, 5), description="Grocery run", merchant="Fresh Market", amount=45.5)],
+        str(db_path),
+        {"groceries": ["Fresh"]},
+    )
+    static_dir = tmp_path.resolve() / "web_ui"
+    (static_dir / "assets").mkdir(parents=True)
+    (static_dir / "index.html").write_text("<title>{{APP_TITLE}}</title>", encoding="utf-8")
+    (static_dir / "assets" / "app.js").write_text("console.log('budgify');\n" * 200, encoding="utf-8")
+    handler = type(
+        "TestHandler",
+        (web.BudgifyWebHandler,),
+        {"db_path": str(db_path), "static_dir": static_dir},
+    )
+    httpd = web.BudgifyHTTPServer(("127.0.0.1", 0), handler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    web._response_cache.clear()
+    web._static_cache.clear()
+    yield httpd, db_path
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def _get(httpd, path, headers=None):
+    conn = http.client.HTTPConnection(*httpd.server_address, timeout=5)
+    conn.request("GET", path, headers=headers or {})
+    response = conn.getresponse()
+    body = response.read()
+    conn.close()
+    return response, body
+
+
+def test_api_responses_are_cached_until_db_changes(server, monkeypatch):
+    httpd, db_path = server
+    calls = []
+    original = web.list_categories
+
+    def counting_list_categories(path):
+        calls.append(path)
+        return original(path)
+
+    monkeypatch.setattr(web, "list_categories", counting_list_categories)
+
+    first, first_body = _get(httpd, "/api/metadata")
+    second, second_body = _get(httpd, "/api/metadata")
+    assert first.status == second.status == 200
+    assert first_body == second_body
+    assert json.loads(first_body)["categories"] == ["groceries"]
+    assert len(calls) == 1
+
+    append_transactions(
+        [Transaction(date=date(2025, 1, 6), description="Cafe", merchant="Bean", amount=4.0)],
+        str(db_path),
+        {"restaurants": ["Bean"]},
+    )
+    _, third_body = _get(httpd, "/api/metadata")
+    assert len(calls) == 2
+    assert json.loads(third_body)["categories"] == ["groceries", "restaurants"]
+
+
+def test_api_errors_are_not_cached(server):
+    httpd, _ = server
+    response, _ = _get(httpd, "/api/summary/period?period=week")
+    assert response.status == 400
+    assert not web._response_cache
+
+
+def test_api_revalidates_with_etag(server):
+    httpd, _ = server
+    first, _ = _get(httpd, "/api/overview")
+    etag = first.getheader("ETag")
+    assert first.status == 200
+    assert etag.startswith('W/"')
+    assert "must-revalidate" in first.getheader("Cache-Control")
+
+    cached, body = _get(httpd, "/api/overview", {"If-None-Match": etag})
+    assert cached.status == 304
+    assert body == b""
+
+    other, _ = _get(httpd, "/api/overview?provider=amex", {"If-None-Match": etag})
+    assert other.status == 200
+    assert other.getheader("ETag") != etag
+
+    error, _ = _get(httpd, "/api/summary/period?period=week")
+    assert error.getheader("ETag") is None
+    assert error.getheader("Cache-Control") == "no-store"
+
+
+def test_requests_share_a_keep_alive_connection(server):
+    httpd, _ = server
+    conn = http.client.HTTPConnection(*httpd.server_address, timeout=5)
+    for path in ("/api/metadata", "/api/overview", "/api/missing"):
+        conn.request("GET", path)
+        response = conn.getresponse()
+        response.read()
+        assert response.version == 11
+        assert not response.will_close
+    conn.close()
+
+
+def test_idle_keep_alive_connections_are_dropped(server, monkeypatch):
+    httpd, _ = server
+    monkeypatch.setattr(httpd.RequestHandlerClass, "timeout", 0.2)
+    conn = http.client.HTTPConnection(*httpd.server_address, timeout=5)
+    conn.request("GET", "/api/metadata")
+    conn.getresponse().read()
+    time.sleep(0.5)
+    assert conn.sock.recv(1) == b""
+    conn.close()
+
+
+def test_slow_readers_receive_the_whole_response(server, monkeypatch):
+    import os
+    import socket
+
+    httpd, _ = server
+    monkeypatch.setattr(httpd.RequestHandlerClass, "timeout", 0.2)
+    image = os.urandom(8 * 1024 * 1024)
+    (httpd.RequestHandlerClass.static_dir / "assets" / "large.png").write_bytes(image)
+
+    with socket.socket() as sock:
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 16 * 1024)
+        sock.settimeout(5)
+        sock.connect(httpd.server_address)
+        sock.sendall(b"GET /assets/large.png HTTP/1.1\r\nHost: test\r\nConnection: close\r\n\r\n")
+        time.sleep(0.6)
+        received = b""
+        while chunk := sock.recv(65536):
+            received += chunk
+
+    headers, _, body = received.partition(b"\r\n\r\n")
+    assert headers.startswith(b"HTTP/1.1 200")
+    assert body == image
+
+
+def test_static_text_assets_and_index_are_served(server):
+    httpd, _ = server
+    response, body = _get(httpd, "/assets/app.js")
+    assert response.status == 200
+    assert body == b"console.log('budgify');\n" * 200
+    assert int(response.getheader("Content-Length")) == len(body)
+    assert response.getheader("Content-Type") == "text/javascript; charset=utf-8"
+    assert "immutable" in response.getheader("Cache-Control")
+
+    index, index_body = _get(httpd, "/")
+    assert index.status == 200
+    assert index_body.startswith(b"<title>Budgify")
+    assert index.getheader("Cache-Control") == "no-store"
+
+    missing, _ = _get(httpd, "/assets/missing.js")
+    assert missing.status == 404
+    escape, _ = _get(httpd, "/../budgify.db")
+    assert escape.status == 404
+
+
+def test_text_assets_are_precompressed_and_revalidated(server):
+    httpd, _ = server
+    plain, plain_body = _get(httpd, "/assets/app.js")
+    assert plain.getheader("Content-Encoding") is None
+    assert plain.getheader("Vary") == "Accept-Encoding"
+
+    zipped, zipped_body = _get(httpd, "/assets/app.js", {"Accept-Encoding": "gzip, deflate"})
+    assert zipped.getheader("Content-Encoding") == "gzip"
+    assert len(zipped_body) < len(plain_body)
+    assert gzip.decompress(zipped_body) == plain_body
+
+    refused, refused_body = _get(httpd, "/assets/app.js", {"Accept-Encoding": "gzip;q=0, identity"})
+    assert refused.getheader("Content-Encoding") is None
+    assert refused_body == plain_body
+
+    etag = plain.getheader("ETag")
+    assert zipped.getheader("ETag") == etag
+    cached, body = _get(httpd, "/assets/app.js", {"If-None-Match": etag})
+    assert cached.status == 304
+    assert cached.getheader("Vary") == "Accept-Encoding"
+    assert body == b""
+
+
+def test_password_protected_requests(server, tmp_path, monkeypatch):
+    import base64
+
+    httpd, _ = server
+    password_file = tmp_path / "password.txt"
+    password_file.write_text(web._encode_password("päss-wörd", web.DEFAULT_PASSWORD_KEY), encoding="utf-8")
+    monkeypatch.setattr(httpd.RequestHandlerClass, "password_file", str(password_file))
+    monkeypatch.setattr(httpd.RequestHandlerClass, "password_key", web.DEFAULT_PASSWORD_KEY)
+
+    def basic(password):
+        token = base64.b64encode(f"user:{password}".encode("utf-8")).decode("ascii")
+        return {"Authorization": f"Basic {token}"}
+
+    denied, _ = _get(httpd, "/api/metadata")
+    assert denied.status == 401
+    wrong, _ = _get(httpd, "/api/metadata", basic("päss"))
+    assert wrong.status == 401
+    allowed, _ = _get(httpd, "/api/metadata", basic("päss-wörd"))
+    assert allowed.status == 200
+
+
+def test_text_assets_are_reloaded_when_the_file_changes(server):
+    import os
+
+    httpd, _ = server
+    manifest = httpd.RequestHandlerClass.static_dir / "manifest.json"
+    manifest.write_text('{"name": "old"}', encoding="utf-8")
+    _, body = _get(httpd, "/manifest.json")
+    assert body == b'{"name": "old"}'
+
+    manifest.write_text('{"name": "rebuilt"}', encoding="utf-8")
+    os.utime(manifest, ns=(0, 10**9))
+    response, body = _get(httpd, "/manifest.json")
+    assert response.getheader("Cache-Control") == "no-store"
+    assert body == b'{"name": "rebuilt"}'
+
+
+def test_binary_assets_are_streamed_over_a_reused_connection(server):
+    import os
+
+    httpd, _ = server
+    image = os.urandom(512 * 1024)
+    (httpd.RequestHandlerClass.static_dir / "assets" / "logo.png").write_bytes(image)
+
+    conn = http.client.HTTPConnection(*httpd.server_address, timeout=5)
+    conn.request("GET", "/assets/logo.png", headers={"Accept-Encoding": "gzip"})
+    response = conn.getresponse()
+    body = response.read()
+    assert response.status == 200
+    assert response.getheader("Content-Type") == "image/png"
+    assert response.getheader("Content-Encoding") is None
+    assert int(response.getheader("Content-Length")) == len(image)
+    assert body == image
+    assert not response.will_close
+
+    sock = conn.sock
+    conn.request("GET", "/api/metadata")
+    follow_up = conn.getresponse()
+    follow_up.read()
+    assert follow_up.status == 200
+    assert conn.sock is sock
+    conn.close()
+
+
+@pytest.mark.parametrize("path", ["/api/assistant/query", "/api/analytics/events"])
+@pytest.mark.parametrize("length", ["abc", "-5"])
+def test_bad_content_length_closes_the_connection(server, path, length):
+    import socket
+
+    httpd, _ = server
+    request = (
+        f"POST {path} HTTP/1.1\r\nHost: test\r\nContent-Length: {length}\r\n\r\n"
+        '{"question": "hi"}'
+        "GET /api/metadata HTTP/1.1\r\nHost: test\r\n\r\n"
+    ).encode("ascii")
+    with socket.create_connection(httpd.server_address, timeout=5) as sock:
+        sock.sendall(request)
+        received = b""
+        while chunk := sock.recv(65536):
+            received += chunk
+
+    assert received.startswith(b"HTTP/1.1 400")
+    assert received.count(b"HTTP/1.") == 1
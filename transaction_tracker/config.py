@@ -5,6 +5,10 @@ from copy import deepcopy
 
 import yaml
 
+try:  # libyaml bindings parse several times faster when available
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # pragma: no cover - depends on how PyYAML was built
+    from yaml import SafeLoader
 
 DEFAULT_CONFIG = {
     "analytics": {
@@ -27,7 +31,7 @@ def _merge_defaults(config: dict, defaults: dict) -> dict:
 
 def load_config(path):
     with open(path, encoding="utf-8") as f:
-        raw = yaml.safe_load(f) or {}
+        raw = yaml.load(f, Loader=SafeLoader) or {}
     if not isinstance(raw, dict):
         return deepcopy(DEFAULT_CONFIG)
     return _merge_defaults(raw, DEFAULT_CONFIG)
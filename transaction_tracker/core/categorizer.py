@@ -1,4 +1,7 @@
 # transaction_tracker/core/categorizer.py
+import re
+
+
 def categorize(tx, categories_map):
     name = tx.merchant.lower()
     desc = tx.description.lower()
@@ -7,4 +10,38 @@ def categorize(tx, categories_map):
         for kw in keywords:
             if kw.lower() in name or kw.lower() in desc:
                 return cat
-    return "misc"
\ No newline at end of file
+    return "misc"
+
+
+def compile_categorizer(categories_map):
+    """Compile ``categories_map`` into a matcher equivalent to ``categorize``.
+
+    Each category's keywords become one lowercase alternation so a
+    transaction costs one regex search per category instead of one
+    substring test per keyword. Categories are still tried in order, and
+    results are memoised per (merchant, description) since recurring
+    expenses repeat the same pair many times.
+    """
+    matchers = [
+        (cat, re.compile('|'.join(re.escape(kw.lower()) for kw in keywords)))
+        for cat, keywords in categories_map.items()
+        if keywords
+    ]
+    cache = {}
+
+    def match(tx):
+        key = (tx.merchant, tx.description)
+        cat = cache.get(key)
+        if cat is None:
+            cat = cache[key] = _match(*key)
+        return cat
+
+    def _match(merchant, description):
+        name = merchant.lower()
+        desc = description.lower()
+        for cat, pattern in matchers:
+            if pattern.search(name) or pattern.search(desc):
+                return cat
+        return "misc"
+
+    return match
@@ -6,7 +6,7 @@ from datetime import date
 from typing import Dict, Iterable, List, Literal
 
 from transaction_tracker.core.models import Transaction
-from transaction_tracker.core.categorizer import categorize
+from transaction_tracker.core.categorizer import compile_categorizer
 
 
 def _init_db(conn: sqlite3.Connection) -> None:
@@ -70,10 +70,10 @@ def append_transactions(
     conn = _connect_db(db_path)
     try:
         _init_db(conn)
-        cat_map = categories or {}
+        categorize_tx = compile_categorizer(categories or {})
         rows = []
         for tx in transactions:
-            cat = categorize(tx, cat_map)
+            cat = categorize_tx(tx)
             provider = tx.provider.strip() if isinstance(tx.provider, str) and tx.provider.strip() else None
             rows.append(
                 (
@@ -1,13 +1,17 @@
 # transaction_tracker/manual.py
 from datetime import datetime, date
 import yaml
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # pragma: no cover - PyYAML built without libyaml
+    from yaml import SafeLoader
 from transaction_tracker.core.models import Transaction
 
 
 def load_manual_transactions(path):
     """Load manual transactions from a YAML file."""
     with open(path) as f:
-        data = yaml.safe_load(f) or []
+        data = yaml.load(f, Loader=SafeLoader) or []
 
     txs = []
     for entry in data:
@@ -5,7 +5,7 @@ import csv
 from datetime import datetime
 from decimal import Decimal
 from transaction_tracker.outputs.base import BaseOutput
-from transaction_tracker.core.categorizer import categorize
+from transaction_tracker.core.categorizer import compile_categorizer
 
 
 class CSVOutput(BaseOutput):
@@ -25,13 +25,14 @@ class CSVOutput(BaseOutput):
 
         # Deduplicate and map
         records = {}
+        categorize_tx = compile_categorizer(self.config['categories'])
         for tx in transactions:
             date_s   = tx.date.isoformat() if hasattr(tx.date, 'isoformat') else str(tx.date)
             desc     = str(tx.description).strip()
             merchant = str(tx.merchant).strip()
             amount   = f"{Decimal(tx.amount):.2f}"
             key      = (date_s, desc, merchant, amount)
-            cat      = categorize(tx, self.config['categories']) or ''
+            cat      = categorize_tx(tx) or ''
             records[key] = {
                 'date':        date_s,
                 'description': desc,
@@ -3,20 +3,22 @@
 """Excel output module backed by XlsxWriter.
 
 This module writes transactions to an Excel workbook. Each month's
-worksheet optionally includes a native PivotTable showing the total
-amount per category for that month. A separate ``Summary`` worksheet is
-generated manually (no Excel PivotTable) to aggregate spending by
-category for each month and overall.
+worksheet is a plain range with an AutoFilter and, when ``emit_pivot`` is
+enabled in the config and supported by XlsxWriter, a native PivotTable
+showing the total amount per category for that month. A separate
+``Summary`` worksheet is generated manually (no Excel PivotTable) to
+aggregate spending by category for each month and overall.
 """
 
 from __future__ import annotations
 
+from collections import Counter
 from datetime import datetime
 import os
 import xlsxwriter
 
 from transaction_tracker.outputs.base import BaseOutput
-from transaction_tracker.core.categorizer import categorize
+from transaction_tracker.core.categorizer import compile_categorizer
 
 
 class ExcelOutput(BaseOutput):
@@ -37,18 +39,40 @@ class ExcelOutput(BaseOutput):
             print("No transactions to write.")
             return
 
-        months = sorted({tx.date.strftime("%Y-%m") for tx in transactions})
-        first_dt = datetime.strptime(months[0], "%Y-%m")
-        year = first_dt.year
+        # Single pass: bucket rows per month and aggregate the summary
+        by_month = {}
+        month_titles = {}
+        monthly_totals = {}
+        summary_data = {}
+        categorize_tx = compile_categorizer(self.config["categories"])
+        for tx in transactions:
+            month_key = (tx.date.year, tx.date.month)
+            sheet_name = month_titles.get(month_key)
+            if sheet_name is None:
+                sheet_name = month_titles[month_key] = tx.date.strftime(self.MONTH_FMT)
+            cat = categorize_tx(tx) or ""
+            row = [
+                tx.date.isoformat(),
+                tx.description,
+                tx.merchant,
+                cat,
+                float(tx.amount),
+            ]
+            by_month.setdefault(month_key, []).append(row)
+            month_summary = summary_data.setdefault(sheet_name, {})
+            month_summary[cat] = month_summary.get(cat, 0.0) + row[4]
+            monthly_totals[sheet_name] = monthly_totals.get(sheet_name, 0.0) + row[4]
+
+        months = sorted(by_month)
+        year = months[0][0]
         out_path = os.path.join(self.output_dir, f"Budget{year}.xlsx")
 
         workbook = xlsxwriter.Workbook(out_path)
         amount_fmt = workbook.add_format({"num_format": "$#,##0.00"})
-        supports_pivot = hasattr(workbook, "add_pivot_table")
+        header_fmt = workbook.add_format({"bold": True, "bg_color": "#E5E5E5"})
+        emit_pivot = hasattr(workbook, "add_pivot_table") and self.config.get("emit_pivot", False)
 
         all_rows = []
-        monthly_totals = {}
-        summary_data = {}
 
         summary_ws = workbook.add_worksheet(self.SUMMARY)
         summary_ws.freeze_panes(1, 0)
@@ -58,31 +82,16 @@ class ExcelOutput(BaseOutput):
         charts_ws.freeze_panes(1, 0)
         charts_ws.set_column(1, 1, None, amount_fmt)
 
-        for month_str in months:
-            dt = datetime.strptime(month_str, "%Y-%m")
-            sheet_name = dt.strftime(self.MONTH_FMT)
+        for month_key in months:
+            sheet_name = month_titles[month_key]
             ws = workbook.add_worksheet(sheet_name)
             ws.freeze_panes(1, 0)
 
             headers = ["date", "description", "merchant", "category", "amount"]
-            ws.write_row(0, 0, headers)
-
-            month_rows = []
-            for tx in transactions:
-                if tx.date.strftime("%Y-%m") != month_str:
-                    continue
-                cat = categorize(tx, self.config["categories"]) or ""
-                row = [
-                    tx.date.isoformat(),
-                    tx.description,
-                    tx.merchant,
-                    cat,
-                    float(tx.amount),
-                ]
-                month_rows.append(row)
-                all_rows.append([sheet_name] + row)
-                summary_data.setdefault(sheet_name, {}).setdefault(cat, 0.0)
-                summary_data[sheet_name][cat] += row[4]
+            ws.write_row(0, 0, headers, header_fmt)
+
+            month_rows = by_month[month_key]
+            all_rows.extend([sheet_name] + row for row in month_rows)
 
             # Sort transactions by absolute amount, largest first
             month_rows.sort(key=lambda r: abs(r[4]), reverse=True)
@@ -90,17 +99,13 @@ class ExcelOutput(BaseOutput):
             row_idx = 1
             for row in month_rows:
                 ws.write_row(row_idx, 0, row[:4])
-                ws.write_number(row_idx, 4, row[4], amount_fmt)
+                ws.write_number(row_idx, 4, row[4])
                 row_idx += 1
 
-            monthly_totals[sheet_name] = sum(r[4] for r in month_rows)
-
             ws.set_column(4, 4, None, amount_fmt)
-            ws.add_table(0, 0, len(month_rows), 4, {
-                "columns": [{"header": h} for h in headers]
-            })
+            ws.autofilter(0, 0, len(month_rows), 4)
 
-            if month_rows and supports_pivot:
+            if month_rows and emit_pivot:
                 data_range = f"A1:E{len(month_rows) + 1}"
                 workbook.add_pivot_table({
                     "name": f"Pivot_{sheet_name.replace(' ', '_')}",
@@ -113,20 +118,18 @@ class ExcelOutput(BaseOutput):
         all_ws = workbook.add_worksheet(self.ALL_DATA)
         all_ws.freeze_panes(1, 0)
         all_headers = ["month", "date", "description", "merchant", "category", "amount"]
-        all_ws.write_row(0, 0, all_headers)
+        all_ws.write_row(0, 0, all_headers, header_fmt)
         for idx, row in enumerate(all_rows, start=1):
             all_ws.write_row(idx, 0, row[:5])
-            all_ws.write_number(idx, 5, row[5], amount_fmt)
+            all_ws.write_number(idx, 5, row[5])
         all_ws.set_column(5, 5, None, amount_fmt)
-        all_ws.add_table(0, 0, len(all_rows), 5, {
-            "columns": [{"header": h} for h in all_headers]
-        })
+        all_ws.autofilter(0, 0, len(all_rows), 5)
 
         # Summary worksheet manually aggregating by month & category
         row_idx = 0
         grand_total = 0.0
-        for month_str in months:
-            sheet_name = datetime.strptime(month_str, "%Y-%m").strftime(self.MONTH_FMT)
+        for month_key in months:
+            sheet_name = month_titles[month_key]
             cats = summary_data.get(sheet_name, {})
             for i, cat in enumerate(sorted(cats)):
                 amount = cats[cat]
@@ -144,7 +147,10 @@ class ExcelOutput(BaseOutput):
         summary_ws.write_number(row_idx, 2, grand_total, amount_fmt)
 
         # Charts worksheet with aggregates and visuals
-        chart_tables = self._build_chart_tables(all_rows, categories=self.config.get("categories", {}))
+        chart_tables = self._build_chart_tables(
+            [all_headers] + all_rows,
+            categories=self.config.get("categories", {}),
+        )
         chart_layout = {}
         start_row = 0
         for key in (
@@ -177,13 +183,11 @@ class ExcelOutput(BaseOutput):
             "subscription": [],
         }
         categories = {**default_categories, **(categories or {})}
-        month_totals = {}
-        restaurant_totals = {}
-        grocery_totals = {}
+        month_totals = Counter()
         category_month_totals = {
-            name: {} for name in categories
+            name: Counter() for name in categories
         }
-        category_totals = {name: 0 for name in categories}
+        category_totals = Counter(dict.fromkeys(categories, 0))
         month_sort = {}
 
         for row in data_rows:
@@ -194,56 +198,37 @@ class ExcelOutput(BaseOutput):
             amount = row[5] or 0
 
             if month:
-                month_totals[month] = month_totals.get(month, 0) + amount
+                month_totals[month] += amount
                 if month not in month_sort:
                     try:
                         month_sort[month] = datetime.strptime(month, self.MONTH_FMT)
                     except ValueError:
                         month_sort[month] = month
 
-            category_norm = category.lower()
-            if category_norm == "restaurants":
-                restaurant_totals[month] = restaurant_totals.get(month, 0) + amount
-            if category_norm == "groceries":
-                grocery_totals[month] = grocery_totals.get(month, 0) + amount
-            if category_norm in category_month_totals and month:
-                category_month_totals[category_norm][month] = (
-                    category_month_totals[category_norm].get(month, 0) + amount
-                )
+            month_totals_for_cat = category_month_totals.get(category.lower())
+            if month_totals_for_cat is not None and month:
+                month_totals_for_cat[month] += amount
 
             if category:
-                category_totals[category] = category_totals.get(category, 0) + amount
+                category_totals[category] += amount
 
         def month_sort_key(value):
             return month_sort.get(value, value)
 
-        monthly_rows = [
-            [month, month_totals[month]]
-            for month in sorted(month_totals, key=month_sort_key)
-        ]
-        restaurant_rows = [
-            [month, restaurant_totals.get(month, 0)]
-            for month in sorted(month_totals, key=month_sort_key)
-        ]
-        grocery_rows = [
-            [month, grocery_totals.get(month, 0)]
-            for month in sorted(month_totals, key=month_sort_key)
-        ]
+        ordered_months = sorted(month_totals, key=month_sort_key)
+        monthly_rows = [[month, month_totals[month]] for month in ordered_months]
         category_month_rows = {}
         for category, totals in category_month_totals.items():
             category_month_rows[category] = [
-                [month, totals.get(month, 0)]
-                for month in sorted(month_totals, key=month_sort_key)
+                [month, totals[month]] for month in ordered_months
             ]
         category_rows = [
             [category, total]
-            for category, total in sorted(category_totals.items(), key=lambda item: item[1], reverse=True)
+            for category, total in category_totals.most_common()
         ]
 
         tables = {
             "monthly": [["Month", "Total"]] + monthly_rows,
-            "restaurants": [["Month", "Total"]] + restaurant_rows,
-            "groceries": [["Month", "Total"]] + grocery_rows,
             "categories": [["Category", "Total"]] + category_rows,
         }
         for category, rows in category_month_rows.items():
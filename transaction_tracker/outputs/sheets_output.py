@@ -1,13 +1,59 @@
 # transaction_tracker/outputs/sheets_output.py
 
+import hashlib
+import time
 import gspread
-from gspread.utils import rowcol_to_a1
 from google.oauth2.service_account import Credentials
 from googleapiclient.discovery import build
-from datetime import datetime
+from collections import Counter, defaultdict
+from datetime import date, datetime
 from calendar import month_name
+from transaction_tracker.core.categorizer import compile_categorizer
 from transaction_tracker.outputs.base import BaseOutput
-from transaction_tracker.core.categorizer import categorize
+
+# Deletes currency symbols/thousands separators from formatted amounts
+_CURRENCY_STRIP = str.maketrans('', '', '$,')
+# Day zero of the Sheets date serial numbering
+_SHEETS_EPOCH = date(1899, 12, 30)
+
+
+def _to_float(val):
+    """Parse a sheet cell into an amount, treating unparseable cells as 0."""
+    if isinstance(val, (int, float)):
+        return float(val)
+    text = str(val).translate(_CURRENCY_STRIP).strip()
+    if not text:
+        # Blank cells are common in padded rows; skip the exception path
+        return 0.0
+    try:
+        return float(text)
+    except ValueError:
+        return 0.0
+
+
+def _cell_data(value):
+    """Convert a Python value into a typed ``CellData`` for ``updateCells``."""
+    if value is None or value == '':
+        return {}
+    if isinstance(value, bool):
+        return {'userEnteredValue': {'boolValue': value}}
+    if isinstance(value, (int, float)):
+        return {'userEnteredValue': {'numberValue': value}}
+    return {'userEnteredValue': {'stringValue': str(value)}}
+
+
+def _date_cell_data(value):
+    """Write ISO date strings as date serial numbers; anything else as-is."""
+    try:
+        serial = (date.fromisoformat(value) - _SHEETS_EPOCH).days
+    except (TypeError, ValueError):
+        return _cell_data(value)
+    return {'userEnteredValue': {'numberValue': serial}}
+
+
+def _rows_fingerprint(rows):
+    """Hash the rows written to a tab so unchanged tabs can be skipped."""
+    return hashlib.blake2b(repr(rows).encode(), digest_size=16).hexdigest()
 
 
 class SheetsOutput(BaseOutput):
@@ -22,6 +68,15 @@ class SheetsOutput(BaseOutput):
     ALL_DATA  = "AllData"
     SUMMARY   = "Summary"
     CHARTS    = "Charts"
+    # Retries (with exponential backoff) on 429/5xx responses per API call
+    API_RETRIES = 5
+    # Seconds that Drive parents/permissions stay cached for the process
+    DRIVE_CACHE_TTL = 300
+    # Shared by every instance: spreadsheet id -> (expires_at, value)
+    _drive_parents_cache = {}
+    _permissions_cache = {}
+    # developerMetadata key holding a hash of the rows last written to a tab
+    FINGERPRINT_KEY = "budgify_rows_hash"
     CHART_CATEGORIES = [
         "car",
         "groceries",
@@ -44,132 +99,130 @@ class SheetsOutput(BaseOutput):
         self.drive_srv  = build('drive', 'v3', credentials=creds)
         self.folder_id  = google_cfg.get('sheet_folder_id')
         self.spreadsheet_id = google_cfg.get('spreadsheet_id')
-        self.owner      = google_cfg.get('owner_email')
+        owners          = google_cfg.get('owner_email') or []
+        self.owners     = [owners] if isinstance(owners, str) else list(owners)
         self.config     = config
+        self._sheet_meta_cache = None
 
     def append(self, transactions):
-        # Determine year
-        months = sorted({tx.date.strftime('%Y-%m') for tx in transactions})
+        # Tab metadata (fingerprints, tables, grid sizes) changes with every
+        # write, so only reuse it within a single append
+        self._sheet_meta_cache = None
+        # Bucket transactions by (year, month) in a single pass, dropping
+        # exact duplicates so direct callers get the same rows as the CLI
+        buckets = defaultdict(list)
+        seen_tx = set()
+        for tx in transactions:
+            key = (tx.date, tx.description, tx.merchant, tx.amount)
+            if key in seen_tx:
+                continue
+            seen_tx.add(key)
+            buckets[(tx.date.year, tx.date.month)].append(tx)
+        months = sorted(buckets)
         if not months:
             return
-        first_dt = datetime.strptime(months[0], '%Y-%m')
-        year = first_dt.year
-        ss_title = ""
+        year = months[0][0]
+        # Open the configured spreadsheet, or open/create the yearly one
         if self.spreadsheet_id:
             sh = self.gc.open_by_key(self.spreadsheet_id)
             created = False
             ss_title = sh.title
         else:
             ss_title = f"Budget {year}"
-
-        # Open or create spreadsheet
-        try:
-            sh = self.gc.open(ss_title)
-            created = False
-        except gspread.exceptions.SpreadsheetNotFound:
-            sh = self.gc.create(ss_title)
-            created = True
+            try:
+                sh = self.gc.open(ss_title)
+                created = False
+            except gspread.exceptions.SpreadsheetNotFound:
+                sh = self.gc.create(ss_title)
+                created = True
 
         # Move/share
         if self.folder_id:
-            meta    = self.drive_srv.files().get(fileId=sh.id, fields='parents').execute()
-            parents = set(meta.get('parents', []))
-            add     = [] if self.folder_id in parents else [self.folder_id]
-            rem     = ['root'] if 'root' in parents else []
-            if add or rem:
-                self.drive_srv.files().update(
-                    fileId        = sh.id,
-                    addParents    = ','.join(add),
-                    removeParents = ','.join(rem),
-                    fields        = 'id,parents'
-                ).execute()
-        if self.owner:
-            try:
-                perms = sh.list_permissions()
-            except Exception:
-                perms = []
-            emails = {p.get('emailAddress') for p in perms}
-            if self.owner not in emails:
-                sh.share(self.owner, perm_type='user', role='writer')
+            self._move_to_folder(sh)
+        if self.owners:
+            self._share_with_owners(sh)
 
         value_updates = []
-        clear_ranges = []
+        clear_ids = []
+        grid_requests = []
         batch_requests = []
         month_rows = {}
+        categorize_tx = compile_categorizer(self.config['categories'])
+        month_titles = {key: date(*key, 1).strftime(self.MONTH_FMT) for key in months}
+
+        # Create every missing tab up front in a single batchUpdate
+        tab_sizes = {title: (100, 10) for title in month_titles.values()}
+        tab_sizes[self.ALL_DATA] = (100, 6)
+        tab_sizes[self.SUMMARY] = (100, 10)
+        tab_sizes[self.CHARTS] = (100, 10)
+        created_tabs = self._ensure_tabs(sh, tab_sizes, created)
+
+        # Sheet ids and stored fingerprints come from the metadata cached by _ensure_tabs
+        meta = self._get_sheet_meta(sh)
+        id_map = {s['properties']['title']: s['properties']['sheetId'] for s in meta}
+        sheet_meta = {s['properties']['title']: s for s in meta}
 
         # 1) Monthly tabs
-        for month_str in months:
-            dt = datetime.strptime(month_str, '%Y-%m')
-            tab_title = dt.strftime(self.MONTH_FMT)
-            txs = [tx for tx in transactions if tx.date.strftime('%Y-%m') == month_str]
-            ws = self._get_tab(sh, tab_title, created)
-            rows = [['date','description','merchant','category','amount']]
-            for tx in txs:
-                rows.append([
-                    tx.date.isoformat(),
-                    tx.description,
-                    tx.merchant,
-                    categorize(tx, self.config['categories']) or '',
-                    tx.amount
-                ])
+        unchanged = set()
+        for month_key in months:
+            tab_title = month_titles[month_key]
+            rows = [['date','description','merchant','category','amount']] + [
+                [tx.date.isoformat(), tx.description, tx.merchant, categorize_tx(tx) or '', tx.amount]
+                for tx in buckets[month_key]
+            ]
             month_rows[tab_title] = rows
-            clear_ranges.append(f"'{tab_title}'!A:Z")
-            end_cell = rowcol_to_a1(len(rows), len(rows[0]))
-            value_updates.append({
-                'range': f"'{tab_title}'!A1:{end_cell}",
-                'values': rows
-            })
-
-        # Ensure aggregate tabs exist before fetching metadata
-        self._get_tab(sh, self.ALL_DATA, created, cols='6')
-        self._get_tab(sh, self.SUMMARY, created, cols='10')
-        self._get_tab(sh, self.CHARTS, created, cols='10')
-
-        # 2) AllData tab: combine & dedupe
-        monthly_data = {}
-        for title, rows in month_rows.items():
-            monthly_data[title] = [r[:5] for r in rows[1:]]
-
-        for ws in sh.worksheets():
-            title = ws.title
-            if title in (self.ALL_DATA, self.SUMMARY) or title in monthly_data:
+            fingerprint = _rows_fingerprint(rows)
+            stored = self._stored_fingerprints(sheet_meta[tab_title])
+            if [md['metadataValue'] for md in stored] == [fingerprint]:
+                # Tab already holds exactly these rows; skip its write pipeline
+                unchanged.add(tab_title)
                 continue
-            monthly_data[title] = [row[:5] for row in ws.get_all_values()[1:]]
+            batch_requests.extend(
+                self._fingerprint_requests(id_map[tab_title], fingerprint, stored)
+            )
+            clear_ids.append(id_map[tab_title])
+            value_updates.append((id_map[tab_title], 0, rows, 0))
+            self._ensure_grid_rows(grid_requests, sheet_meta[tab_title], len(rows))
 
+        # 2) AllData tab: combine & dedupe
         all_rows = [['month','date','description','merchant','category','amount']]
         seen = set()
-        for title, data_rows in monthly_data.items():
-            for r in data_rows:
-                key = (title,) + tuple(r)
-                if key not in seen:
-                    seen.add(key)
-                    val = r[4] if len(r) > 4 else 0
-                    try:
-                        amount = float(
-                            val if isinstance(val, (int, float))
-                            else str(val).replace("$", "").replace(",", "")
-                        )
-                    except Exception:
-                        amount = 0.0
-                    all_rows.append([title] + r[:4] + [amount])
-
-        clear_ranges.append(f"'{self.ALL_DATA}'!A:Z")
-        end_cell = rowcol_to_a1(len(all_rows), len(all_rows[0]))
-        value_updates.append({
-            'range': f"'{self.ALL_DATA}'!A1:{end_cell}",
-            'values': all_rows
-        })
 
-        # Fetch metadata once for sheet ids
-        meta = self.sheets_srv.spreadsheets().get(
-            spreadsheetId=sh.id,
-            fields='sheets(properties,tables)'
-        ).execute()['sheets']
-        id_map = {s['properties']['title']: s['properties']['sheetId'] for s in meta}
-        sheet_meta = {s['properties']['title']: s for s in meta}
+        # Rows from this run are already in memory with numeric amounts
+        for title, rows in month_rows.items():
+            for r in rows[1:]:
+                key = "\x1f".join([title, *map(str, r)])
+                if key in seen:
+                    continue
+                seen.add(key)
+                all_rows.append([title] + r[:4] + [float(r[4])])
+
+        # Read every other month tab's data columns in a single batchGet
+        other_titles = [
+            s['properties']['title'] for s in self._get_sheet_meta(sh)
+            if s['properties']['title'] not in (self.ALL_DATA, self.SUMMARY, self.CHARTS)
+            and s['properties']['title'] not in month_rows
+        ]
+        value_ranges = []
+        if other_titles:
+            value_ranges = self.sheets_srv.spreadsheets().values().batchGet(
+                spreadsheetId=sh.id,
+                ranges=[f"'{title}'!A2:E" for title in other_titles],
+                majorDimension='ROWS'
+            ).execute(num_retries=self.API_RETRIES).get('valueRanges', [])
+        for title, value_range in zip(other_titles, value_ranges):
+            for r in value_range.get('values', []):
+                r = r + [''] * (5 - len(r))
+                key = "\x1f".join([title, *map(str, r)])
+                if key in seen:
+                    continue
+                seen.add(key)
+                all_rows.append([title] + r[:4] + [_to_float(r[4])])
 
         # Build requests for monthly tabs
         for title, rows in month_rows.items():
+            if title in unchanged:
+                continue
             sheet_id = id_map[title]
             table_range = {
                 'sheetId': sheet_id,
@@ -191,10 +244,72 @@ class SheetsOutput(BaseOutput):
                 self._month_pivot_request(sheet_id, len(rows))
             )
             batch_requests.extend(
-                self._formatting_requests(sheet_id, len(rows[0]), amount_col_index=4, tab_rgb=(0.6,0.8,1.0))
+                self._formatting_requests(sheet_id, len(rows[0]), amount_col_index=4, tab_rgb=(0.6,0.8,1.0), date_col_index=0)
             )
 
-        # Requests for AllData tab
+        # 3) AllData, Summary and Charts are all derived from these rows, so they
+        # share one fingerprint stored on the AllData tab; a tab recreated in
+        # this run is empty and forces the rebuild regardless
+        all_fingerprint = _rows_fingerprint(all_rows)
+        all_stored = self._stored_fingerprints(sheet_meta[self.ALL_DATA])
+        aggregate_recreated = created_tabs & {self.ALL_DATA, self.SUMMARY, self.CHARTS}
+        if aggregate_recreated or [md['metadataValue'] for md in all_stored] != [all_fingerprint]:
+            batch_requests.extend(
+                self._fingerprint_requests(id_map[self.ALL_DATA], all_fingerprint, all_stored)
+            )
+            self._aggregate_tab_requests(
+                all_rows, id_map, sheet_meta,
+                clear_ids, value_updates, grid_requests, batch_requests
+            )
+
+        # 4) Reorder tabs
+        ordered = [self.SUMMARY, self.CHARTS, self.ALL_DATA]
+        for m in range(1,13):
+            t = f"{month_name[m]} {year}"
+            if t in id_map:
+                ordered.append(t)
+        # Walk the current order and only move tabs that are out of place.
+        # Earlier slots are already settled, so each move is to the left and
+        # its index needs no before-the-move adjustment.
+        positions = sorted(sheet_meta, key=lambda t: sheet_meta[t]['properties'].get('index', len(sheet_meta)))
+        for idx, title in enumerate(ordered):
+            if positions[idx] == title:
+                continue
+            positions.remove(title)
+            positions.insert(idx, title)
+            batch_requests.append({
+                'updateSheetProperties': {
+                    'properties': {'sheetId': id_map[title], 'index': idx},
+                    'fields': 'index'
+                }
+            })
+
+        # Clear, resize and write values ahead of the structural requests so
+        # the whole rebuild goes out in a single batchUpdate
+        requests = [self._clear_values_request(sheet_id) for sheet_id in clear_ids]
+        requests.extend(grid_requests)
+        requests.extend(
+            self._update_cells_request(*update) for update in value_updates
+        )
+        requests.extend(batch_requests)
+        # A re-run with unchanged data leaves nothing to send, and the API
+        # rejects an empty request list
+        if requests:
+            self.sheets_srv.spreadsheets().batchUpdate(
+                spreadsheetId=sh.id,
+                body={'requests': requests}
+            ).execute(num_retries=self.API_RETRIES)
+            for idx, title in enumerate(positions):
+                sheet_meta[title]['properties']['index'] = idx
+
+        print(f"Built tabs for {len(months)} months, AllData, Summary, and reordered tabs in '{ss_title}'.")
+
+    def _aggregate_tab_requests(self, all_rows, id_map, sheet_meta,
+                                clear_ids, value_updates, grid_requests, batch_requests):
+        """Queue the rebuild of the AllData, Summary and Charts tabs."""
+        clear_ids.append(id_map[self.ALL_DATA])
+        value_updates.append((id_map[self.ALL_DATA], 0, all_rows, 1))
+        self._ensure_grid_rows(grid_requests, sheet_meta[self.ALL_DATA], len(all_rows))
         all_sheet_id = id_map[self.ALL_DATA]
         all_table_range = {
             'sheetId': all_sheet_id,
@@ -213,12 +328,12 @@ class SheetsOutput(BaseOutput):
             )
         )
         batch_requests.extend(
-            self._formatting_requests(all_sheet_id, len(all_rows[0]), amount_col_index=5, tab_rgb=(0.9,0.9,0.9))
+            self._formatting_requests(all_sheet_id, len(all_rows[0]), amount_col_index=5, tab_rgb=(0.9,0.9,0.9), date_col_index=1)
         )
 
-        # 3) Summary tab: single pivot grouping month & category
-        clear_ranges.append(f"'{self.SUMMARY}'!A:Z")
-        clear_ranges.append(f"'{self.CHARTS}'!A:Z")
+        # Summary tab: single pivot grouping month & category
+        clear_ids.append(id_map[self.SUMMARY])
+        clear_ids.append(id_map[self.CHARTS])
         summary_sheet_id = id_map[self.SUMMARY]
         batch_requests.append(
             self._summary_pivot_request(
@@ -231,7 +346,7 @@ class SheetsOutput(BaseOutput):
             self._formatting_requests(summary_sheet_id, 10, amount_col_index=4, tab_rgb=(0.7,0.7,0.7))
         )
 
-        # 4) Charts tab with aggregated tables + visuals
+        # Charts tab with aggregated tables + visuals
         chart_sheet_id = id_map[self.CHARTS]
         chart_tables = self._build_chart_tables(all_rows)
         chart_layout = {}
@@ -242,13 +357,9 @@ class SheetsOutput(BaseOutput):
                 'start_row': start_row,
                 'row_count': len(table)
             }
-            end_cell = rowcol_to_a1(start_row + len(table), 2)
-            value_updates.append({
-                'range': f"'{self.CHARTS}'!A{start_row + 1}:{end_cell}",
-                'values': table
-            })
+            value_updates.append((chart_sheet_id, start_row, table, None))
             start_row += len(table) + 2
-        self._ensure_chart_grid_size(batch_requests, chart_sheet_id, start_row)
+        self._ensure_chart_grid_size(grid_requests, chart_sheet_id, start_row)
         batch_requests.extend(
             self._charts_tab_requests(
                 chart_sheet_id,
@@ -256,44 +367,77 @@ class SheetsOutput(BaseOutput):
             )
         )
 
-        # 5) Reorder tabs
-        ordered = [self.SUMMARY, self.CHARTS, self.ALL_DATA]
-        for m in range(1,13):
-            t = f"{month_name[m]} {year}"
-            if t in id_map:
-                ordered.append(t)
-        for idx, title in enumerate(ordered):
-            sid = id_map[title]
-            batch_requests.append({
-                'updateSheetProperties': {
-                    'properties': {'sheetId': sid, 'index': idx},
-                    'fields': 'index'
-                }
-            })
-
-        # Execute batched operations to minimise API calls
-        if clear_ranges:
-            self.sheets_srv.spreadsheets().values().batchClear(
-                spreadsheetId=sh.id,
-                body={'ranges': clear_ranges}
-            ).execute()
-
-        if value_updates:
-            self.sheets_srv.spreadsheets().values().batchUpdate(
-                spreadsheetId=sh.id,
-                body={
-                    'valueInputOption': 'USER_ENTERED',
-                    'data': value_updates
-                }
-            ).execute()
-
-        if batch_requests:
-            self.sheets_srv.spreadsheets().batchUpdate(
-                spreadsheetId=sh.id,
-                body={'requests': batch_requests}
-            ).execute()
-
-        print(f"Built tabs for {len(months)} months, AllData, Summary, and reordered tabs in '{ss_title}'.")
+    def _cache_get(self, cache, key):
+        entry = cache.get(key)
+        if entry is None or entry[0] < time.monotonic():
+            return None
+        return entry[1]
+
+    def _cache_put(self, cache, key, value):
+        cache[key] = (time.monotonic() + self.DRIVE_CACHE_TTL, value)
+
+    def _move_to_folder(self, sh):
+        parents = self._cache_get(self._drive_parents_cache, sh.id)
+        if parents is None:
+            meta = self.drive_srv.files().get(
+                fileId=sh.id,
+                fields='parents',
+                supportsAllDrives=True
+            ).execute(num_retries=self.API_RETRIES)
+            parents = set(meta.get('parents', []))
+        add = [] if self.folder_id in parents else [self.folder_id]
+        rem = ['root'] if 'root' in parents else []
+        if add or rem:
+            self.drive_srv.files().update(
+                fileId            = sh.id,
+                addParents        = ','.join(add),
+                removeParents     = ','.join(rem),
+                fields            = 'id,parents',
+                supportsAllDrives = True
+            ).execute(num_retries=self.API_RETRIES)
+            parents = (parents - set(rem)) | set(add)
+        self._cache_put(self._drive_parents_cache, sh.id, parents)
+
+    def _share_with_owners(self, sh):
+        emails = self._cache_get(self._permissions_cache, sh.id)
+        if emails is None:
+            try:
+                perms = sh.list_permissions()
+            except Exception:
+                perms = []
+            emails = {p.get('emailAddress', '').casefold() for p in perms}
+        emails = set(emails)
+        errors = []
+        # Batch request ids must be unique, so collapse repeated owners
+        # (emails compare case-insensitively)
+        missing = {}
+        for owner in self.owners:
+            key = owner.casefold()
+            if key not in emails:
+                missing.setdefault(key, owner)
+        if missing:
+            # One Drive batch request shares with every missing owner
+            def on_response(request_id, _response, exception):
+                if exception is None:
+                    emails.add(request_id)
+                else:
+                    errors.append(exception)
+
+            batch = self.drive_srv.new_batch_http_request(callback=on_response)
+            for key, owner in missing.items():
+                batch.add(
+                    self.drive_srv.permissions().create(
+                        fileId=sh.id,
+                        body={'type': 'user', 'role': 'writer', 'emailAddress': owner},
+                        fields='id',
+                        supportsAllDrives=True
+                    ),
+                    request_id=key
+                )
+            batch.execute()
+        self._cache_put(self._permissions_cache, sh.id, emails)
+        if errors:
+            raise errors[0]
 
     def _table_and_sort_requests(self, sheet_id, row_count, column_count, amount_col_index, apply_filter=True):
         if row_count <= 1 or column_count == 0:
@@ -356,15 +500,108 @@ class SheetsOutput(BaseOutput):
         cols_overlap = left[2] < right[3] and right[2] < left[3]
         return rows_overlap and cols_overlap
 
-    def _get_tab(self, sh, title, created_ss, rows='100', cols='10'):
-        try:
-            return sh.worksheet(title)
-        except gspread.exceptions.WorksheetNotFound:
-            if created_ss and sh.sheet1.title == 'Sheet1':
-                ws = sh.sheet1
-                ws.update_title(title)
-                return ws
-            return sh.add_worksheet(title=title, rows=rows, cols=cols)
+    def _ensure_tabs(self, sh, tab_sizes, created_ss):
+        """Create any tabs in ``tab_sizes`` (title -> (rows, cols)) that are missing.
+
+        Returns the set of titles that were created.
+        """
+        meta = self._get_sheet_meta(sh)
+        existing = {s['properties']['title']: s['properties'] for s in meta}
+        missing = [title for title in tab_sizes if title not in existing]
+        if not missing:
+            return set()
+        created = set(missing)
+
+        requests = []
+        if created_ss and 'Sheet1' in existing:
+            # Reuse the default sheet of a freshly created spreadsheet
+            default_props = existing['Sheet1']
+            requests.append({
+                'updateSheetProperties': {
+                    'properties': {
+                        'sheetId': default_props['sheetId'],
+                        'title': missing[0]
+                    },
+                    'fields': 'title'
+                }
+            })
+            default_props['title'] = missing.pop(0)
+        for title in missing:
+            rows, cols = tab_sizes[title]
+            requests.append({
+                'addSheet': {
+                    'properties': {
+                        'title': title,
+                        'gridProperties': {'rowCount': rows, 'columnCount': cols}
+                    }
+                }
+            })
+        response = self.sheets_srv.spreadsheets().batchUpdate(
+            spreadsheetId=sh.id,
+            body={'requests': requests}
+        ).execute(num_retries=self.API_RETRIES)
+
+        # Record the new tabs in the cached metadata instead of refetching it
+        for reply in response.get('replies', []):
+            added = reply.get('addSheet')
+            if added:
+                meta.append({'properties': added['properties']})
+        return created
+
+    def _stored_fingerprints(self, sheet_meta):
+        return [
+            md for md in sheet_meta.get('developerMetadata', [])
+            if md.get('metadataKey') == self.FINGERPRINT_KEY
+        ]
+
+    def _fingerprint_requests(self, sheet_id, fingerprint, stored=()):
+        """Return requests leaving exactly one fingerprint entry on the tab."""
+        if len(stored) == 1:
+            return [{
+                'updateDeveloperMetadata': {
+                    'dataFilters': [{
+                        'developerMetadataLookup': {'metadataId': stored[0]['metadataId']}
+                    }],
+                    'developerMetadata': {'metadataValue': fingerprint},
+                    'fields': 'metadataValue'
+                }
+            }]
+        requests = []
+        if stored:
+            # Duplicate entries can't be trusted; replace them all
+            requests.append({
+                'deleteDeveloperMetadata': {
+                    'dataFilter': {
+                        'developerMetadataLookup': {
+                            'metadataKey': self.FINGERPRINT_KEY,
+                            'metadataLocation': {'sheetId': sheet_id}
+                        }
+                    }
+                }
+            })
+        requests.append({
+            'createDeveloperMetadata': {
+                'developerMetadata': {
+                    'metadataKey': self.FINGERPRINT_KEY,
+                    'metadataValue': fingerprint,
+                    'location': {'sheetId': sheet_id},
+                    'visibility': 'DOCUMENT'
+                }
+            }
+        })
+        return requests
+
+    def _get_sheet_meta(self, sh):
+        """Return sheet properties/tables for ``sh``, fetching them at most once."""
+        cached = self._sheet_meta_cache
+        if cached is not None and cached[0] == sh.id:
+            return cached[1]
+        meta = self.sheets_srv.spreadsheets().get(
+            spreadsheetId=sh.id,
+            fields='sheets(properties,tables,developerMetadata)'
+        ).execute(num_retries=self.API_RETRIES)['sheets']
+        self._sheet_meta_cache = (sh.id, meta)
+        return meta
 
     def _month_pivot_request(self, sheet_id, row_count):
         return {
@@ -441,7 +678,7 @@ class SheetsOutput(BaseOutput):
             }
         }
 
-    def _formatting_requests(self, sheet_id, column_count, amount_col_index, tab_rgb=(0.8,0.9,1.0)):
+    def _formatting_requests(self, sheet_id, column_count, amount_col_index, tab_rgb=(0.8,0.9,1.0), date_col_index=None):
         header_fmt = {
             'repeatCell': {
                 'range': {
@@ -500,7 +737,66 @@ class SheetsOutput(BaseOutput):
             }
         }
 
-        return [header_fmt, amount_fmt, freeze_req]
+        requests = [header_fmt, amount_fmt, freeze_req]
+        if date_col_index is not None:
+            requests.append({
+                'repeatCell': {
+                    'range': {
+                        'sheetId': sheet_id,
+                        'startRowIndex': 1,
+                        'startColumnIndex': date_col_index,
+                        'endColumnIndex': date_col_index + 1
+                    },
+                    'cell': {
+                        'userEnteredFormat': {
+                            'numberFormat': {
+                                'type': 'DATE',
+                                'pattern': 'yyyy-mm-dd'
+                            }
+                        }
+                    },
+                    'fields': 'userEnteredFormat.numberFormat'
+                }
+            })
+        return requests
+
+    def _clear_values_request(self, sheet_id):
+        return {
+            'updateCells': {
+                'range': {'sheetId': sheet_id},
+                'fields': 'userEnteredValue'
+            }
+        }
+
+    def _update_cells_request(self, sheet_id, start_row, rows, date_col=None):
+        return {
+            'updateCells': {
+                'start': {'sheetId': sheet_id, 'rowIndex': start_row, 'columnIndex': 0},
+                'rows': [
+                    {'values': [
+                        _date_cell_data(value) if col == date_col else _cell_data(value)
+                        for col, value in enumerate(row)
+                    ]}
+                    for row in rows
+                ],
+                'fields': 'userEnteredValue'
+            }
+        }
+
+    def _ensure_grid_rows(self, grid_requests, sheet_meta, row_count):
+        # updateCells does not grow the grid the way the values API does
+        props = sheet_meta['properties']
+        if props.get('gridProperties', {}).get('rowCount', 0) >= row_count:
+            return
+        grid_requests.append({
+            'updateSheetProperties': {
+                'properties': {
+                    'sheetId': props['sheetId'],
+                    'gridProperties': {'rowCount': row_count}
+                },
+                'fields': 'gridProperties.rowCount'
+            }
+        })
 
     def _ensure_chart_grid_size(self, batch_requests, chart_sheet_id, row_count, column_count=10):
         if row_count <= 0:
@@ -520,9 +816,9 @@ class SheetsOutput(BaseOutput):
 
     def _build_chart_tables(self, all_rows):
         data_rows = all_rows[1:]
-        month_totals = {}
-        category_totals = {}
-        category_month_totals = {category: {} for category in self.CHART_CATEGORIES}
+        month_totals = Counter()
+        category_totals = Counter()
+        category_month_totals = {category: Counter() for category in self.CHART_CATEGORIES}
         month_sort = {}
 
         for row in data_rows:
@@ -533,39 +829,35 @@ class SheetsOutput(BaseOutput):
             amount = row[5] or 0
 
             if month:
-                month_totals[month] = month_totals.get(month, 0) + amount
+                month_totals[month] += amount
                 if month not in month_sort:
                     try:
                         month_sort[month] = datetime.strptime(month, self.MONTH_FMT)
                     except ValueError:
                         month_sort[month] = month
 
-            category_norm = category.lower()
-            if category_norm in category_month_totals:
-                category_month_totals[category_norm][month] = (
-                    category_month_totals[category_norm].get(month, 0) + amount
-                )
+            month_totals_for_cat = category_month_totals.get(category.lower())
+            if month_totals_for_cat is not None:
+                month_totals_for_cat[month] += amount
 
             if category:
-                category_totals[category] = category_totals.get(category, 0) + amount
+                category_totals[category] += amount
 
         def month_sort_key(value):
             return month_sort.get(value, value)
 
-        monthly_rows = [
-            [month, month_totals[month]]
-            for month in sorted(month_totals, key=month_sort_key)
-        ]
+        ordered_months = sorted(month_totals, key=month_sort_key)
+        monthly_rows = [[month, month_totals[month]] for month in ordered_months]
         category_rows = [
             [category, total]
-            for category, total in sorted(category_totals.items(), key=lambda item: item[1], reverse=True)
+            for category, total in category_totals.most_common()
         ]
         category_tables = {
             category: [
                 ['Month', 'Total'],
                 *[
-                    [month, category_month_totals[category].get(month, 0)]
-                    for month in sorted(month_totals, key=month_sort_key)
+                    [month, category_month_totals[category][month]]
+                    for month in ordered_months
                 ],
             ]
             for category in self.CHART_CATEGORIES
@@ -26,14 +26,29 @@ def _add_months(original_date: date, months: int) -> date:
     return date(year, month, day)
 
 
-def _next_date(current_date: date, cadence: str) -> date:
-    if cadence == "daily":
-        return current_date + timedelta(days=1)
-    if cadence == "weekly":
-        return current_date + timedelta(weeks=1)
+_CADENCE_STEPS = {
+    "daily": timedelta(days=1),
+    "weekly": timedelta(weeks=1),
+}
+
+
+def _schedule(start_date: date, end_date: date, cadence: str, count: Optional[int]) -> List[date]:
+    """Return every occurrence from ``start_date`` through ``end_date``, inclusive."""
     if cadence == "monthly":
-        return _add_months(current_date, 1)
-    raise ValueError(f"Unsupported cadence '{cadence}'.")
+        months = (end_date.year - start_date.year) * 12 + end_date.month - start_date.month
+        if months >= 0 and _add_months(start_date, months) <= end_date:
+            months += 1
+        total = max(months, 0)
+        if count is not None:
+            total = min(total, count)
+        return [_add_months(start_date, k) for k in range(total)]
+    step = _CADENCE_STEPS.get(cadence)
+    if step is None:
+        raise ValueError(f"Unsupported cadence '{cadence}'.")
+    total = max((end_date - start_date) // step + 1, 0)
+    if count is not None:
+        total = min(total, count)
+    return [start_date + step * k for k in range(total)]
 
 
 def _expand_entry(entry) -> List[Transaction]:
@@ -60,29 +75,16 @@ def _expand_entry(entry) -> List[Transaction]:
     merchant = entry.get("merchant", "")
     amount = float(entry.get("amount", 0.0))
 
-    transactions = []
-    current = start_date
-    generated = 0
-    while True:
-        if end_date is not None and current > end_date:
-            break
-        if count is not None and generated >= count:
-            break
-        transactions.append(
-            Transaction(
-                date=current,
-                description=description,
-                merchant=merchant,
-                amount=amount,
-                provider="recurring",
-            )
+    transactions = [
+        Transaction(
+            date=current,
+            description=description,
+            merchant=merchant,
+            amount=amount,
+            provider="recurring",
         )
-        generated += 1
-        if cadence == "monthly":
-            current = _add_months(start_date, generated)
-        else:
-            current = _next_date(current, cadence)
-
+        for current in _schedule(start_date, end_date, cadence, count)
+    ]
     return transactions
 
 
@@ -11,12 +11,10 @@ def filter_transactions_by_month(transactions, month_str):
 def dedupe_transactions(transactions):
     """
     Remove duplicates based on (date, description, merchant, amount).
+    The first occurrence of each key wins, in input order.
     """
-    seen = set()
-    unique = []
+    unique = {}
+    keep_first = unique.setdefault
     for tx in transactions:
-        key = (tx.date, tx.description, tx.merchant, tx.amount)
-        if key not in seen:
-            seen.add(key)
-            unique.append(tx)
-    return unique
\ No newline at end of file
+        keep_first((tx.date, tx.description, tx.merchant, tx.amount), tx)
+    return list(unique.values())
\ No newline at end of file
@@ -2,9 +2,16 @@ from __future__ import annotations
 
 import argparse
 import base64
+import gzip
+import hashlib
 import html
 import json
 import os
+import socket
+import stat
+import threading
+import zlib
+from collections import OrderedDict
 from datetime import date
 from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
@@ -13,6 +20,11 @@ from urllib.parse import parse_qs, urlparse, unquote
 
 import hmac
 
+try:
+    import orjson
+except ImportError:  # optional: faster JSON encoding when installed
+    orjson = None
+
 from transaction_tracker.ai.assistant import query_finance_assistant
 from transaction_tracker.ai.config import ai_status
 from transaction_tracker.ai.finance_tools import ToolValidationError
@@ -35,14 +47,31 @@ from transaction_tracker.database import (
     summarize_by_period,
 )
 
-STATIC_DIR = Path(__file__).with_name("web_ui")
+# Resolved once here; handlers compare request paths against it as-is
+STATIC_DIR = Path(__file__).with_name("web_ui").resolve()
+# Text assets are read and gzipped once per file version; entries are keyed
+# on (mtime, size) so a rebuilt web_ui is picked up without a restart.
+_COMPRESSIBLE_SUFFIXES = frozenset({".css", ".js", ".mjs", ".json", ".map", ".svg"})
+_static_cache: dict[Path, tuple[tuple[int, int], tuple[str, bytes, bytes | None, str]]] = {}
+_static_cache_lock = threading.Lock()
 DEFAULT_PASSWORD_KEY = "Altaf Hussain"
 DEFAULT_UI_HOME_NAME = "Ali's Home"
+# Serialized GET /api/* bodies, keyed by (db path, path, query, db mtime/size)
+RESPONSE_CACHE_MAX = 256
+_response_cache: OrderedDict[tuple, bytes] = OrderedDict()
+_response_cache_lock = threading.Lock()
+# Browsers may reuse an /api body briefly, then must revalidate via ETag
+API_CACHE_CONTROL = "private, max-age=5, must-revalidate"
+# ((path, key, mtime_ns, size), decoded password) of the last password file read
+_password_cache: tuple[tuple, tuple[str, bytes]] | None = None
 
 
 
 def _xor_bytes(data: bytes, key: bytes) -> bytes:
-    return bytes(byte ^ key[idx % len(key)] for idx, byte in enumerate(data))
+    # XOR as two big integers instead of looping over bytes in Python
+    size = len(data)
+    stream = (key * (size // len(key) + 1))[:size]
+    return (int.from_bytes(data, "big") ^ int.from_bytes(stream, "big")).to_bytes(size, "big")
 
 
 def _encode_password(password: str, key: str) -> str:
@@ -77,12 +106,29 @@ def _extract_auth_password(header_value: str | None) -> str | None:
     return None
 
 
-def _load_password_file(path: str, key: str) -> str | None:
+def _password_digest(password: str) -> bytes:
+    return hashlib.sha256(password.encode("utf-8")).digest()
+
+
+def _load_password_entry(path: str, key: str) -> tuple[str, bytes] | None:
+    # Called on every request: only re-read and decode when the file changes
+    global _password_cache
+    try:
+        st = os.stat(path)
+    except (FileNotFoundError, PermissionError):
+        return None
+    cache_key = (path, key, st.st_mtime_ns, st.st_size)
+    cached = _password_cache
+    if cached is not None and cached[0] == cache_key:
+        return cached[1]
     try:
         payload = Path(path).read_text(encoding="utf-8")
     except (FileNotFoundError, IsADirectoryError, PermissionError):
         return None
-    return _decode_password(payload, key)
+    password = _decode_password(payload, key)
+    entry = (password, _password_digest(password))
+    _password_cache = (cache_key, entry)
+    return entry
 
 
 def _parse_date(value: str | None) -> date | None:
@@ -121,6 +167,46 @@ def _parse_float_env(value: str | None, default: float) -> float:
         return default
 
 
+# Query-string specs for _extract_params: key -> parser (None keeps the raw
+# string), or (parser, default) to substitute a default for empty results
+_SUMMARY_PARAMS = {
+    "start_date": _parse_date,
+    "end_date": _parse_date,
+    "category": None,
+    "exclude_category": None,
+    "provider": None,
+}
+_OVERVIEW_PARAMS = {
+    **_SUMMARY_PARAMS,
+    "merchant": None,
+    "merchant_regex": None,
+    "min_amount": _parse_float,
+    "max_amount": _parse_float,
+}
+_TRANSACTION_PARAMS = {
+    **_OVERVIEW_PARAMS,
+    "sort_by": (None, "date"),
+    "sort_dir": (None, "asc"),
+    "group_by": None,
+    "limit": (_parse_int, 200),
+    "offset": (_parse_int, 0),
+}
+
+
+def _extract_params(query: dict[str, list[str]], spec: dict[str, Any]) -> dict[str, Any]:
+    params = {}
+    for key, parser in spec.items():
+        default = None
+        if isinstance(parser, tuple):
+            parser, default = parser
+        values = query.get(key)
+        value = values[0] if values else None
+        if parser is not None:
+            value = parser(value)
+        params[key] = value if default is None else (value or default)
+    return params
+
+
 def _get_ui_text() -> dict[str, str]:
     app_name = os.environ.get("BUDGIFY_UI_APP_NAME", "Budgify").strip() or "Budgify"
     home_name = os.environ.get("BUDGIFY_UI_HOME_NAME", DEFAULT_UI_HOME_NAME).strip() or DEFAULT_UI_HOME_NAME
@@ -168,25 +254,94 @@ def _render_index_html(html_text: str, handler: "BudgifyWebHandler" | None = Non
     return rendered
 
 
+def _dump_json(payload: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(payload).encode("utf-8")
+
+
 def _json_response(handler: BaseHTTPRequestHandler, payload: Any, status: int = 200) -> None:
-    body = json.dumps(payload).encode("utf-8")
+    _json_response_raw(handler, _dump_json(payload), status)
+
+
+def _json_response_raw(
+    handler: BaseHTTPRequestHandler,
+    body: bytes,
+    status: int = 200,
+    etag: str | None = None,
+) -> None:
     handler.send_response(status)
     handler.send_header("Content-Type", "application/json")
-    handler.send_header("Cache-Control", "no-store")
+    if etag:
+        handler.send_header("ETag", etag)
+        handler.send_header("Cache-Control", API_CACHE_CONTROL)
+    else:
+        handler.send_header("Cache-Control", "no-store")
     handler.send_header("Content-Length", str(len(body)))
     handler.end_headers()
     handler.wfile.write(body)
 
 
-def _read_json_body(handler: BaseHTTPRequestHandler) -> dict[str, Any]:
-    length_value = handler.headers.get("Content-Length", "0")
+def _response_cache_key(db_path: str, path: str, query: str) -> tuple | None:
     try:
-        length = int(length_value)
-    except ValueError as exc:
-        raise ValueError("invalid Content-Length") from exc
-    if length <= 0:
+        st = os.stat(db_path)
+    except OSError:
+        return None
+    return (str(db_path), path, query, st.st_mtime_ns, st.st_size)
+
+
+def _response_etag(cache_key: tuple | None) -> str | None:
+    if cache_key is None:
+        return None
+    _db, path, query, mtime_ns, size = cache_key
+    digest = zlib.crc32(f"{path}?{query}".encode("utf-8"))
+    return f'W/"{mtime_ns:x}-{size:x}-{digest:x}"'
+
+
+def _etag_matches(header_value: str | None, etag: str) -> bool:
+    if not header_value:
+        return False
+    candidates = {value.strip() for value in header_value.split(",")}
+    return etag in candidates or "*" in candidates
+
+
+def _response_cache_get(key: tuple | None) -> bytes | None:
+    if key is None:
+        return None
+    with _response_cache_lock:
+        body = _response_cache.get(key)
+        if body is not None:
+            _response_cache.move_to_end(key)
+        return body
+
+
+def _response_cache_put(key: tuple | None, body: bytes) -> None:
+    if key is None:
+        return
+    with _response_cache_lock:
+        _response_cache[key] = body
+        _response_cache.move_to_end(key)
+        while len(_response_cache) > RESPONSE_CACHE_MAX:
+            _response_cache.popitem(last=False)
+
+
+def _read_request_body(handler: BaseHTTPRequestHandler) -> bytes:
+    try:
+        length = int(handler.headers.get("Content-Length") or 0)
+    except ValueError:
+        length = -1
+    if length < 0:
+        # The body can't be located, so whatever follows on a keep-alive
+        # connection can't be trusted as the next request
+        handler.close_connection = True
+        raise ValueError("invalid Content-Length")
+    return handler.rfile.read(length) if length else b""
+
+
+def _read_json_body(handler: BaseHTTPRequestHandler) -> dict[str, Any]:
+    raw = _read_request_body(handler)
+    if not raw:
         return {}
-    raw = handler.rfile.read(length)
     try:
         payload = json.loads(raw.decode("utf-8"))
     except (json.JSONDecodeError, UnicodeDecodeError) as exc:
@@ -197,6 +352,14 @@ def _read_json_body(handler: BaseHTTPRequestHandler) -> dict[str, Any]:
 
 
 class BudgifyWebHandler(BaseHTTPRequestHandler):
+    # Keep-alive lets the dashboard's parallel API fetches share connections;
+    # every response must therefore send Content-Length.
+    protocol_version = "HTTP/1.1"
+    # Seconds a keep-alive connection may wait for its next request before its
+    # worker thread drops it. Once a request starts arriving the socket uses
+    # request_timeout instead, so slow uploads and downloads are not cut off.
+    timeout = 5
+    request_timeout: float | None = None
     db_path = "budgify.db"
     static_dir = STATIC_DIR
     password_file: str | None = None
@@ -208,6 +371,18 @@ class BudgifyWebHandler(BaseHTTPRequestHandler):
     def log_message(self, format: str, *args: Any) -> None:
         return
 
+    def handle_one_request(self) -> None:
+        self.connection.settimeout(self.timeout)
+        try:
+            pending = self.rfile.peek(1)
+        except socket.timeout:
+            pending = b""
+        if not pending:
+            self.close_connection = True
+            return
+        self.connection.settimeout(self.request_timeout)
+        super().handle_one_request()
+
     def do_GET(self) -> None:
         if not self._authorize_request():
             return
@@ -227,139 +402,133 @@ class BudgifyWebHandler(BaseHTTPRequestHandler):
         if parsed.path.startswith("/api/"):
             self._handle_post_api(parsed)
             return
+        # The request body was not read, so the connection can't be reused
+        self.close_connection = True
         _json_response(self, {"error": "not found"}, status=404)
 
+    # GET /api/* path -> handler method; each takes (query, categories) and
+    # returns the JSON payload, or None once it has written its own response
+    _API_ROUTES = {
+        "/api/assistant/status": "_api_assistant_status",
+        "/api/metadata": "_api_metadata",
+        "/api/analytics/top-events": "_api_analytics_top_events",
+        "/api/analytics/session-flows": "_api_analytics_session_flows",
+        "/api/analytics/search-trends": "_api_analytics_search_trends",
+        "/api/analytics/feature-usage": "_api_analytics_feature_usage",
+        "/api/analytics/filters-sorts": "_api_analytics_filters_sorts",
+        "/api/overview": "_api_overview",
+        "/api/summary/category": "_api_summary_category",
+        "/api/summary/period": "_api_summary_period",
+        "/api/summary/merchant": "_api_summary_merchant",
+        "/api/transactions": "_api_transactions",
+    }
+
     def _handle_api(self, parsed) -> None:
-        query = parse_qs(parsed.query)
-        categories = _get_categories(query)
         path = parsed.path
+        method_name = self._API_ROUTES.get(path)
+        if method_name is None:
+            _json_response(self, {"error": "not found"}, status=404)
+            return
 
-        try:
-            if path == "/api/assistant/status":
-                _json_response(self, ai_status())
-                return
-
-            if path == "/api/metadata":
-                payload = {
-                    "categories": list_categories(self.db_path),
-                    "providers": list_providers(self.db_path),
-                    "merchants": list_unique_merchants(self.db_path),
-                }
-                _json_response(self, payload)
-                return
-
-            if path == "/api/analytics/top-events":
-                limit = _parse_int(_get_param(query, "limit"), default=10) or 10
-                _json_response(self, analytics_top_events(self.db_path, limit=limit))
-                return
-
-            if path == "/api/analytics/session-flows":
-                limit = _parse_int(_get_param(query, "limit"), default=20) or 20
-                _json_response(self, analytics_session_flows(self.db_path, limit=limit))
-                return
-
-            if path == "/api/analytics/search-trends":
-                limit = _parse_int(_get_param(query, "limit"), default=20) or 20
-                _json_response(self, analytics_search_trends(self.db_path, limit=limit))
-                return
-
-            if path == "/api/analytics/feature-usage":
-                limit = _parse_int(_get_param(query, "limit"), default=20) or 20
-                _json_response(self, analytics_feature_usage_counts(self.db_path, limit=limit))
-                return
-
-            if path == "/api/analytics/filters-sorts":
-                _json_response(self, analytics_common_filters_sorts(self.db_path))
-                return
-
-            if path == "/api/overview":
-                payload = overview_metrics(
-                    self.db_path,
-                    start_date=_parse_date(_get_param(query, "start_date")),
-                    end_date=_parse_date(_get_param(query, "end_date")),
-                    category=_get_param(query, "category"),
-                    categories=categories,
-                    exclude_category=_get_param(query, "exclude_category"),
-                    provider=_get_param(query, "provider"),
-                    merchant=_get_param(query, "merchant"),
-                    min_amount=_parse_float(_get_param(query, "min_amount")),
-                    max_amount=_parse_float(_get_param(query, "max_amount")),
-                    merchant_regex=_get_param(query, "merchant_regex"),
-                )
-                _json_response(self, payload)
-                return
-
-            if path == "/api/summary/category":
-                payload = summarize_by_category(
-                    self.db_path,
-                    start_date=_parse_date(_get_param(query, "start_date")),
-                    end_date=_parse_date(_get_param(query, "end_date")),
-                    category=_get_param(query, "category"),
-                    categories=categories,
-                    exclude_category=_get_param(query, "exclude_category"),
-                    provider=_get_param(query, "provider"),
-                )
-                _json_response(self, payload)
-                return
-
-            if path == "/api/summary/period":
-                period = _get_param(query, "period")
-                if period not in ("month", "quarter", "year"):
-                    _json_response(self, {"error": "period must be month, quarter, or year"}, status=400)
-                    return
-                payload = summarize_by_period(
-                    self.db_path,
-                    period=period,
-                    start_date=_parse_date(_get_param(query, "start_date")),
-                    end_date=_parse_date(_get_param(query, "end_date")),
-                    category=_get_param(query, "category"),
-                    categories=categories,
-                    exclude_category=_get_param(query, "exclude_category"),
-                    provider=_get_param(query, "provider"),
-                )
-                _json_response(self, payload)
-                return
-
-            if path == "/api/summary/merchant":
-                limit = _parse_int(_get_param(query, "limit"), default=15) or 15
-                payload = summarize_by_merchant(
-                    self.db_path,
-                    start_date=_parse_date(_get_param(query, "start_date")),
-                    end_date=_parse_date(_get_param(query, "end_date")),
-                    category=_get_param(query, "category"),
-                    categories=categories,
-                    exclude_category=_get_param(query, "exclude_category"),
-                    provider=_get_param(query, "provider"),
-                )
-                _json_response(self, payload[:limit])
-                return
+        # Any write to the database changes its mtime and so misses the cache.
+        # Assistant status depends on the environment, so it is never cached.
+        cache_key = None
+        if path != "/api/assistant/status":
+            cache_key = _response_cache_key(self.db_path, path, parsed.query)
+        etag = _response_etag(cache_key)
+        if etag and _etag_matches(self.headers.get("If-None-Match"), etag):
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.send_header("Cache-Control", API_CACHE_CONTROL)
+            self.end_headers()
+            return
+        cached = _response_cache_get(cache_key)
+        if cached is not None:
+            _json_response_raw(self, cached, etag=etag)
+            return
 
-            if path == "/api/transactions":
-                payload = query_transactions(
-                    self.db_path,
-                    start_date=_parse_date(_get_param(query, "start_date")),
-                    end_date=_parse_date(_get_param(query, "end_date")),
-                    category=_get_param(query, "category"),
-                    categories=categories,
-                    exclude_category=_get_param(query, "exclude_category"),
-                    provider=_get_param(query, "provider"),
-                    merchant=_get_param(query, "merchant"),
-                    merchant_regex=_get_param(query, "merchant_regex"),
-                    min_amount=_parse_float(_get_param(query, "min_amount")),
-                    max_amount=_parse_float(_get_param(query, "max_amount")),
-                    sort_by=_get_param(query, "sort_by") or "date",
-                    sort_dir=_get_param(query, "sort_dir") or "asc",
-                    group_by=_get_param(query, "group_by"),
-                    limit=_parse_int(_get_param(query, "limit"), default=200) or 200,
-                    offset=_parse_int(_get_param(query, "offset"), default=0) or 0,
-                )
-                _json_response(self, payload)
-                return
+        query = parse_qs(parsed.query)
+        try:
+            payload = getattr(self, method_name)(query, _get_categories(query))
         except Exception as exc:
             _json_response(self, {"error": str(exc)}, status=500)
             return
-
-        _json_response(self, {"error": "not found"}, status=404)
+        if payload is None:
+            return
+        body = _dump_json(payload)
+        _response_cache_put(cache_key, body)
+        _json_response_raw(self, body, etag=etag)
+
+    def _api_assistant_status(self, query, categories) -> Any:
+        return ai_status()
+
+    def _api_metadata(self, query, categories) -> Any:
+        return {
+            "categories": list_categories(self.db_path),
+            "providers": list_providers(self.db_path),
+            "merchants": list_unique_merchants(self.db_path),
+        }
+
+    def _api_analytics_top_events(self, query, categories) -> Any:
+        limit = _parse_int(_get_param(query, "limit"), default=10) or 10
+        return analytics_top_events(self.db_path, limit=limit)
+
+    def _api_analytics_session_flows(self, query, categories) -> Any:
+        limit = _parse_int(_get_param(query, "limit"), default=20) or 20
+        return analytics_session_flows(self.db_path, limit=limit)
+
+    def _api_analytics_search_trends(self, query, categories) -> Any:
+        limit = _parse_int(_get_param(query, "limit"), default=20) or 20
+        return analytics_search_trends(self.db_path, limit=limit)
+
+    def _api_analytics_feature_usage(self, query, categories) -> Any:
+        limit = _parse_int(_get_param(query, "limit"), default=20) or 20
+        return analytics_feature_usage_counts(self.db_path, limit=limit)
+
+    def _api_analytics_filters_sorts(self, query, categories) -> Any:
+        return analytics_common_filters_sorts(self.db_path)
+
+    def _api_overview(self, query, categories) -> Any:
+        return overview_metrics(
+            self.db_path,
+            categories=categories,
+            **_extract_params(query, _OVERVIEW_PARAMS),
+        )
+
+    def _api_summary_category(self, query, categories) -> Any:
+        return summarize_by_category(
+            self.db_path,
+            categories=categories,
+            **_extract_params(query, _SUMMARY_PARAMS),
+        )
+
+    def _api_summary_period(self, query, categories) -> Any:
+        period = _get_param(query, "period")
+        if period not in ("month", "quarter", "year"):
+            _json_response(self, {"error": "period must be month, quarter, or year"}, status=400)
+            return None
+        return summarize_by_period(
+            self.db_path,
+            period=period,
+            categories=categories,
+            **_extract_params(query, _SUMMARY_PARAMS),
+        )
+
+    def _api_summary_merchant(self, query, categories) -> Any:
+        limit = _parse_int(_get_param(query, "limit"), default=15) or 15
+        payload = summarize_by_merchant(
+            self.db_path,
+            categories=categories,
+            **_extract_params(query, _SUMMARY_PARAMS),
+        )
+        return payload[:limit]
+
+    def _api_transactions(self, query, categories) -> Any:
+        return query_transactions(
+            self.db_path,
+            categories=categories,
+            **_extract_params(query, _TRANSACTION_PARAMS),
+        )
 
     def _handle_assistant_query(self) -> None:
         try:
@@ -393,10 +562,14 @@ class BudgifyWebHandler(BaseHTTPRequestHandler):
     def _handle_post_api(self, parsed) -> None:
         if parsed.path == "/api/analytics/events":
             if not self.analytics_enabled:
+                self.close_connection = True
                 _json_response(self, {"accepted": 0}, status=202)
                 return
-            length = int(self.headers.get("Content-Length") or 0)
-            body = self.rfile.read(length) if length > 0 else b""
+            try:
+                body = _read_request_body(self)
+            except ValueError as exc:
+                _json_response(self, {"error": str(exc)}, status=400)
+                return
             try:
                 payload = json.loads(body.decode("utf-8") or "{}")
             except json.JSONDecodeError:
@@ -411,78 +584,153 @@ class BudgifyWebHandler(BaseHTTPRequestHandler):
                 print(f"[analytics] stored {len(events)} event(s)")
             _json_response(self, {"accepted": len(events)}, status=202)
             return
+        self.close_connection = True
         _json_response(self, {"error": "not found"}, status=404)
+
     def _handle_static(self, raw_path: str) -> None:
-        static_root = Path(self.static_dir).resolve()
+        static_root = self.static_dir
         path = raw_path or "/"
         if path == "/":
             path = "/index.html"
         resolved = (static_root / unquote(path.lstrip("/"))).resolve()
-        if static_root not in resolved.parents and resolved != static_root:
+        if not str(resolved).startswith(str(static_root) + os.sep):
             self.send_error(404)
             return
-        if not resolved.exists() or not resolved.is_file():
+        if "/assets/" in resolved.as_posix():
+            cache_control = "public, max-age=31536000, immutable"
+        else:
+            cache_control = "no-store"
+
+        try:
+            st = os.stat(resolved)
+        except OSError:
+            self.send_error(404)
+            return
+        if not stat.S_ISREG(st.st_mode):
             self.send_error(404)
             return
 
+        if resolved.suffix in _COMPRESSIBLE_SUFFIXES and resolved.name != "index.html":
+            self._send_static_asset(_load_static_asset(resolved, st), cache_control)
+            return
+
         content_type = _guess_content_type(resolved)
         if resolved.name == "index.html":
             body = _render_index_html(resolved.read_text(encoding="utf-8"), self).encode("utf-8")
-        else:
-            body = resolved.read_bytes()
+            self._send_static_headers(content_type, len(body), "no-store")
+            self.wfile.write(body)
+            return
+
+        with open(resolved, "rb") as src:
+            self._send_static_headers(content_type, st.st_size, cache_control)
+            # Let the kernel copy the file to the socket (os.sendfile where
+            # available) instead of reading it into memory first
+            self.connection.sendfile(src)
+
+    def _send_static_headers(self, content_type: str, length: int, cache_control: str) -> None:
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(length))
+        self.send_header("Cache-Control", cache_control)
+        self.end_headers()
+
+    def _send_static_asset(self, asset: tuple[str, bytes, bytes | None, str], cache_control: str) -> None:
+        content_type, raw, compressed, etag = asset
+        if _etag_matches(self.headers.get("If-None-Match"), etag):
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.send_header("Cache-Control", cache_control)
+            self.send_header("Vary", "Accept-Encoding")
+            self.end_headers()
+            return
+        use_gzip = compressed is not None and _accepts_gzip(self.headers.get("Accept-Encoding"))
+        body = compressed if use_gzip else raw
         self.send_response(200)
         self.send_header("Content-Type", content_type)
         self.send_header("Content-Length", str(len(body)))
-        if resolved.name == "index.html":
-            self.send_header("Cache-Control", "no-store")
-        elif "/assets/" in resolved.as_posix():
-            self.send_header("Cache-Control", "public, max-age=31536000, immutable")
-        else:
-            self.send_header("Cache-Control", "no-store")
+        self.send_header("Cache-Control", cache_control)
+        self.send_header("ETag", etag)
+        self.send_header("Vary", "Accept-Encoding")
+        if use_gzip:
+            self.send_header("Content-Encoding", "gzip")
         self.end_headers()
         self.wfile.write(body)
 
     def _authorize_request(self) -> bool:
         if not self.password_file:
             return True
-        expected = _load_password_file(self.password_file, self.password_key)
+        expected = _load_password_entry(self.password_file, self.password_key)
         if expected is None:
             self.send_error(500, "Password file not found")
             return False
         provided = _extract_auth_password(self.headers.get("Authorization"))
-        if provided is None or not hmac.compare_digest(provided, expected):
+        # Comparing fixed-size digests keeps the check constant-time regardless
+        # of password length and accepts non-ASCII passwords
+        if provided is None or not hmac.compare_digest(_password_digest(provided), expected[1]):
+            # Any request body is left unread, so close after replying
+            self.close_connection = True
             self.send_response(401)
             self.send_header("WWW-Authenticate", 'Basic realm="Budgify"')
             self.send_header("Cache-Control", "no-store")
+            self.send_header("Content-Length", "0")
             self.end_headers()
             return False
         return True
 
 
+def _accepts_gzip(header_value: str | None) -> bool:
+    if not header_value:
+        return False
+    qualities = {}
+    for item in header_value.split(","):
+        coding, _, params = item.partition(";")
+        quality = 1.0
+        for param in params.split(";"):
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        qualities[coding.strip().lower()] = quality
+    if "gzip" in qualities:
+        return qualities["gzip"] > 0
+    return qualities.get("*", 0.0) > 0
+
+
+def _load_static_asset(path: Path, st: os.stat_result) -> tuple[str, bytes, bytes | None, str]:
+    version = (st.st_mtime_ns, st.st_size)
+    cached = _static_cache.get(path)
+    if cached is not None and cached[0] == version:
+        return cached[1]
+    raw = path.read_bytes()
+    compressed = gzip.compress(raw, compresslevel=9, mtime=0)
+    if len(compressed) >= len(raw):
+        compressed = None
+    etag = f'W/"{zlib.crc32(raw):x}-{len(raw):x}"'
+    asset = (_guess_content_type(path), raw, compressed, etag)
+    with _static_cache_lock:
+        _static_cache[path] = (version, asset)
+    return asset
+
+
+_CONTENT_TYPES = {
+    ".html": "text/html; charset=utf-8",
+    ".css": "text/css; charset=utf-8",
+    ".js": "text/javascript; charset=utf-8",
+    ".mjs": "text/javascript; charset=utf-8",
+    ".json": "application/json",
+    ".map": "application/json",
+    ".svg": "image/svg+xml",
+    ".png": "image/png",
+    ".ico": "image/x-icon",
+    ".woff2": "font/woff2",
+    ".woff": "font/woff",
+}
+
+
 def _guess_content_type(path: Path) -> str:
-    if path.suffix == ".html":
-        return "text/html; charset=utf-8"
-    if path.suffix == ".css":
-        return "text/css; charset=utf-8"
-    if path.suffix == ".js":
-        return "text/javascript; charset=utf-8"
-    if path.suffix == ".mjs":
-        return "text/javascript; charset=utf-8"
-    if path.suffix == ".json":
-        return "application/json"
-    if path.suffix == ".map":
-        return "application/json"
-    if path.suffix == ".svg":
-        return "image/svg+xml"
-    if path.suffix == ".png":
-        return "image/png"
-    if path.suffix == ".ico":
-        return "image/x-icon"
-    if path.suffix == ".woff2":
-        return "font/woff2"
-    if path.suffix == ".woff":
-        return "font/woff"
-    return "application/octet-stream"
+    return _CONTENT_TYPES.get(path.suffix, "application/octet-stream")
 
 
 def _get_param(query: dict[str, list[str]], key: str) -> str | None:
@@ -507,6 +755,12 @@ def _get_categories(query: dict[str, list[str]]) -> list[str] | None:
     return list(dict.fromkeys(categories))
 
 
+class BudgifyHTTPServer(ThreadingHTTPServer):
+    # The dashboard fans out several API requests per page load; the stdlib
+    # default backlog of 5 makes bursts wait on SYN retransmits.
+    request_queue_size = 128
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(description="Budgify web dashboard")
     parser.add_argument("--db", dest="db_path", default="budgify.db", help="Path to SQLite database")
@@ -555,7 +809,7 @@ def main() -> None:
             "analytics_dev_logging": args.analytics_dev_logging,
         },
     )
-    server = ThreadingHTTPServer((args.host, args.port), handler)
+    server = BudgifyHTTPServer((args.host, args.port), handler)
     print(f"Budgify web UI running at http://{args.host}:{args.port} (db: {args.db_path})")
     server.serve_forever()
 